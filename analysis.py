@@ -0,0 +1,254 @@
+"""
+Replay and analysis of saved games.
+
+Games are streamed from binary record files (see records.py) or JSON save
+files and replayed move by move through TicTacToe.make_move. Every move is
+compared with the engine: the exact scores of all replies come from the
+solved game (the same depth-weighted scores SmartComputerPlayer.minimax
+uses, seen from the side to move), so each move gets the optimal move, the
+best score and the score of the move actually played. Moves are flagged as
+
+    missed_win    an immediate win was available and not taken
+    missed_block  the opponent threatened to win next move and it was not blocked
+    lost_draw     the position was drawn with best play and the move loses it
+    lost_win      the position was won with best play and the move throws it away
+
+Large inputs are cut into chunks of encoded records that worker processes
+analyze; only a bounded number of chunks is in flight and reports come back
+in input order, so memory stays flat however many games are read.
+
+Usage:
+    python analysis.py games.ttr tictactoe_save.json --workers 4 --output games.jsonl --summary summary.json
+"""
+
+# Developed by phoenix marie.
+import argparse
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import TicTacToe
+from records import decode_record, encode_record, iter_records, record_from_state
+import solved
+
+FLAGS = ('missed_win', 'missed_block', 'lost_draw', 'lost_win')
+SWAP = {'X': 'O', 'O': 'X', ' ': ' '}
+
+_solutions = None
+
+
+def solutions():
+    """Solved scores of every reachable position, computed once per process."""
+    global _solutions
+    if _solutions is None:
+        _solutions = solved.solve()
+    return _solutions
+
+
+def move_scores(board):
+    """
+    Scores every legal move of a position for the side to move.
+
+    Args:
+        board: A 9-square board reachable with X moving first.
+
+    Returns:
+        dict: square -> score of the position after that move, for the player who made it.
+    """
+    table = solutions()
+    letter = solved.side_to_move(board)
+    code = solved.position_code(board)
+    digit = solved.DIGITS[letter]
+    return {square: -table[code + digit * solved.POWERS[square]][1]
+            for square in range(9) if board[square] == ' '}
+
+
+def analyze_record(record):
+    """
+    Replays one game and scores every move.
+
+    Returns:
+        dict: 'result', 'moves' (one dict per move with 'ply', 'letter', 'square',
+        'best_move', 'best_score', 'score' and 'flags') and 'flags' (counts per flag).
+    """
+    game = TicTacToe()
+    # the solved game assumes X moves first, so O-first games are scored with the letters swapped
+    swap = record.first_letter == 'O'
+    letter = record.first_letter
+    moves = []
+    counts = dict.fromkeys(FLAGS, 0)
+    for ply, square in enumerate(record.moves):
+        if game.current_winner or not game.empty_squares():
+            raise ValueError("Recorded game continues after it has finished.")
+        other = 'O' if letter == 'X' else 'X'
+        engine_board = [SWAP[spot] for spot in game.board] if swap else game.board
+        scores = move_scores(engine_board)
+        if square not in scores:
+            raise ValueError(f"Square {square} is already taken at ply {ply}.")
+        # first strictly better square, the move minimax would play
+        best_move = max(scores, key=lambda move: (scores[move], -move))
+        best_score, score = scores[best_move], scores[square]
+        wins = game.find_winning_moves(letter)
+        threats = game.find_winning_moves(other)
+
+        flags = []
+        if wins and square not in wins:
+            flags.append('missed_win')
+        elif not wins and threats and square not in threats:
+            flags.append('missed_block')
+        if best_score == 0 and score < 0:
+            flags.append('lost_draw')
+        elif best_score > 0 and score <= 0:
+            flags.append('lost_win')
+        for flag in flags:
+            counts[flag] += 1
+
+        game.make_move(square, letter)
+        moves.append({'ply': ply, 'letter': letter, 'square': square, 'best_move': best_move,
+                      'best_score': best_score, 'score': score, 'flags': flags})
+        letter = other
+    result = game.current_winner or ('tie' if not game.empty_squares() else None)
+    return {'result': result, 'moves': moves, 'flags': counts}
+
+
+def analyze_chunk(data, first_index):
+    """Analyzes a chunk of encoded records; runs inside the worker pool."""
+    reports = []
+    offset = 0
+    index = first_index
+    while offset < len(data):
+        record, offset = decode_record(data, offset)
+        try:
+            report = analyze_record(record)
+        except ValueError as e:
+            report = {'error': str(e)}
+        report['game'] = index
+        reports.append(report)
+        index += 1
+    return reports
+
+
+def iter_games(paths):
+    """Streams GameRecords from record files and JSON save files."""
+    for path in paths:
+        if path.endswith('.json'):
+            with open(path) as f:
+                yield record_from_state(json.load(f))
+        else:
+            yield from iter_records(path)
+
+
+def iter_chunks(records, chunk_size):
+    """Groups records into (encoded bytes, index of the first game) chunks."""
+    data = bytearray()
+    first_index = index = 0
+    for record in records:
+        data += encode_record(record)
+        index += 1
+        if index - first_index == chunk_size:
+            yield bytes(data), first_index
+            data = bytearray()
+            first_index = index
+    if data:
+        yield bytes(data), first_index
+
+
+def analyze(paths, workers=None, chunk_size=500):
+    """
+    Streams the analysis of every game in ``paths``.
+
+    Args:
+        paths (list): Record files and/or JSON save files.
+        workers (int, optional): Worker processes; defaults to the CPU count.
+            With one worker the games are analyzed in this process.
+        chunk_size (int): Games per unit of work.
+
+    Yields:
+        dict: One report per game (see analyze_record) with its 'game' index, in input order.
+    """
+    chunks = iter_chunks(iter_games(paths), chunk_size)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for data, first_index in chunks:
+            yield from analyze_chunk(data, first_index)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # oldest chunk first keeps the output in input order; the window bounds memory
+        pending = deque()
+        for data, first_index in chunks:
+            pending.append(pool.submit(analyze_chunk, data, first_index))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class Summary():
+    """Aggregate statistics over analyzed games."""
+    def __init__(self):
+        self.games = 0
+        self.errors = 0
+        self.results = {'X': 0, 'O': 0, 'tie': 0, 'unfinished': 0}
+        self.moves = {'X': 0, 'O': 0}
+        self.best_moves = {'X': 0, 'O': 0}
+        self.flags = {letter: dict.fromkeys(FLAGS, 0) for letter in ('X', 'O')}
+
+    def add(self, report):
+        self.games += 1
+        if 'error' in report:
+            self.errors += 1
+            return
+        self.results[report['result'] or 'unfinished'] += 1
+        for move in report['moves']:
+            letter = move['letter']
+            self.moves[letter] += 1
+            if move['score'] == move['best_score']:
+                self.best_moves[letter] += 1
+            for flag in move['flags']:
+                self.flags[letter][flag] += 1
+
+    def as_dict(self):
+        return {
+            'games': self.games,
+            'errors': self.errors,
+            'results': self.results,
+            'moves': self.moves,
+            # share of moves that kept the best score available
+            'accuracy': {letter: self.best_moves[letter] / self.moves[letter] if self.moves[letter] else 0.0
+                         for letter in self.moves},
+            'flags': self.flags,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay saved Tic Tac Toe games and flag blunders.")
+    parser.add_argument('paths', nargs='+', help="binary record files or JSON save files")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--output', help="write one JSON report per game to this file")
+    parser.add_argument('--summary', help="write the aggregate report to this file")
+    args = parser.parse_args(argv)
+
+    summary = Summary()
+    output = open(args.output, 'w') if args.output else None
+    try:
+        for report in analyze(args.paths, args.workers, args.chunk_size):
+            summary.add(report)
+            if output is not None:
+                output.write(json.dumps(report) + '\n')
+    finally:
+        if output is not None:
+            output.close()
+
+    totals = summary.as_dict()
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump(totals, f, indent=2)
+    print(json.dumps(totals, indent=2))
+    return totals
+
+
+if __name__ == '__main__':
+    main()
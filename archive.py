@@ -0,0 +1,250 @@
+"""
+Game archive with a memory-mapped position index.
+
+Games are stored in a binary record file (see records.py) and indexed by
+every position they passed through, after folding symmetric positions
+together (see symmetry.canonical_code). For each canonical position the
+index keeps the outcome counts and the byte offsets of the games, so "which games reached this board" and
+"how often does X win from here" are answered with a binary search over the
+memory-mapped index instead of a scan of the archive.
+
+Index file layout (little endian):
+
+    magic (8 bytes) | indexed archive bytes (u64) | positions (u32) | offsets (u64)
+    positions x (code u32, X wins u32, O wins u32, ties u32, unfinished u32,
+                 first offset slot u64, offset count u32), sorted by code
+    offsets x u64 game offsets
+
+The index remembers how much of the archive it covers, so update_index()
+only reads games appended since the last update.
+"""
+
+# Developed by phoenix marie.
+import mmap
+import os
+import struct
+
+from engine import TicTacToe
+from records import RecordWriter, decode_record, iter_records, record_from_state, state_from_record
+import symmetry
+
+INDEX_MAGIC = b'TTTIDX1\n'
+HEADER = struct.Struct('<8sQIQ')
+ENTRY = struct.Struct('<IIIIIQI')
+OUTCOMES = ('X', 'O', 'tie', 'unfinished')
+
+
+def record_positions(record):
+    """Yields the canonical code of every position in a game, starting from the empty board."""
+    # the code of each of the 8 transformed boards, updated move by move
+    codes = [0] * len(symmetry.SQUARE_WEIGHTS)
+    digit = symmetry.DIGITS[record.first_letter]
+    yield 0
+    for square in record.moves:
+        for transform, weights in enumerate(symmetry.SQUARE_WEIGHTS):
+            codes[transform] += digit * weights[square]
+        digit = 3 - digit
+        yield min(codes)
+
+
+class PositionIndex():
+    """Read-only memory-mapped view of an index file."""
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.indexed_upto, self.num_positions, self.num_offsets = HEADER.unpack_from(self.data, 0)
+        if magic != INDEX_MAGIC:
+            self.data.close()
+            raise ValueError(f"{path} is not a position index.")
+        self.entries_start = HEADER.size
+        self.offsets_start = HEADER.size + self.num_positions * ENTRY.size
+
+    def close(self):
+        self.data.close()
+
+    def find(self, code):
+        """Returns the index entry for a canonical code, or None."""
+        low, high = 0, self.num_positions - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry = ENTRY.unpack_from(self.data, self.entries_start + middle * ENTRY.size)
+            if entry[0] == code:
+                return entry
+            if entry[0] < code:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def offsets(self, entry):
+        first, count = entry[5], entry[6]
+        start = self.offsets_start + first * 8
+        return list(struct.unpack_from(f'<{count}Q', self.data, start))
+
+    def entries(self):
+        for i in range(self.num_positions):
+            yield ENTRY.unpack_from(self.data, self.entries_start + i * ENTRY.size)
+
+
+class GameArchive():
+    """An append-only archive of games plus its position index."""
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.writer = None
+        self.index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_game(self, game):
+        """Appends a finished or unfinished game (anything with get_game_state)."""
+        self.add_state(game.get_game_state())
+
+    def add_state(self, game_state):
+        if self.writer is None:
+            self.writer = RecordWriter(self.path)
+        self.writer.write(record_from_state(game_state))
+
+    def flush(self):
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+
+    def update_index(self):
+        """
+        Indexes the games appended since the last update and rewrites the index file.
+
+        Only the new games are collected in memory. The old index is streamed
+        into the new file alongside them: both are sorted by code, so one
+        merge pass writes the entries and a second copies each position's old
+        offsets straight out of the memory map before appending the new ones.
+
+        Returns:
+            int: Number of newly indexed games.
+        """
+        self.flush()
+        if not os.path.exists(self.path):
+            return 0
+        old_index = self.open_index()
+        start = old_index.indexed_upto if old_index is not None else None
+
+        counts = {}  # code -> [X, O, tie, unfinished], new games only
+        offsets = {}  # code -> [game offsets], new games only
+        new_games = 0
+        indexed_upto = start
+        for offset, record in iter_records(self.path, with_offsets=True, start=start):
+            outcome = OUTCOMES.index(record.result if record.result is not None else 'unfinished')
+            for code in record_positions(record):
+                if code not in counts:
+                    counts[code] = [0, 0, 0, 0]
+                    offsets[code] = []
+                counts[code][outcome] += 1
+                offsets[code].append(offset)
+            new_games += 1
+            indexed_upto = offset + 1 + (len(record.moves) + 1) // 2
+        if not new_games:
+            return 0
+
+        new_offsets = sum(len(o) for o in offsets.values())
+        old_offsets = old_index.num_offsets if old_index is not None else 0
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            positions = len(counts)
+            if old_index is not None:
+                positions += sum(1 for entry in old_index.entries() if entry[0] not in counts)
+            f.write(HEADER.pack(INDEX_MAGIC, indexed_upto, positions, old_offsets + new_offsets))
+            slot = 0
+            for code, old_entry, added in self._merged_entries(old_index, counts):
+                total = list(old_entry[1:5]) if old_entry else [0, 0, 0, 0]
+                count = old_entry[6] if old_entry else 0
+                if added:
+                    total = [a + b for a, b in zip(total, added)]
+                    count += len(offsets[code])
+                f.write(ENTRY.pack(code, *total, slot, count))
+                slot += count
+            for code, old_entry, _ in self._merged_entries(old_index, counts):
+                if old_entry:
+                    first = old_index.offsets_start + old_entry[5] * 8
+                    f.write(old_index.data[first:first + old_entry[6] * 8])
+                if code in offsets:
+                    f.write(struct.pack(f'<{len(offsets[code])}Q', *offsets[code]))
+        if old_index is not None:
+            old_index.close()
+            self.index = None
+        os.replace(tmp_path, self.index_path)
+        return new_games
+
+    @staticmethod
+    def _merged_entries(old_index, counts):
+        """
+        Yields (code, old entry or None, new counts or None) in code order.
+
+        Walks the old index's entries and the sorted codes of the new games
+        together, so the old index is never loaded as a whole.
+        """
+        new_codes = iter(sorted(counts))
+        code = next(new_codes, None)
+        for entry in (old_index.entries() if old_index is not None else ()):
+            while code is not None and code < entry[0]:
+                yield code, None, counts[code]
+                code = next(new_codes, None)
+            if code == entry[0]:
+                yield code, entry, counts[code]
+                code = next(new_codes, None)
+            else:
+                yield entry[0], entry, None
+        while code is not None:
+            yield code, None, counts[code]
+            code = next(new_codes, None)
+
+    def open_index(self):
+        if self.index is None:
+            try:
+                self.index = PositionIndex(self.index_path)
+            except (OSError, ValueError):
+                return None
+        return self.index
+
+    def _entry(self, board):
+        index = self.open_index()
+        if index is None:
+            return index, None
+        return index, index.find(symmetry.canonical_code(board))
+
+    def outcomes(self, board):
+        """Outcome counts of the indexed games that passed through ``board`` (or a symmetric board)."""
+        _, entry = self._entry(board)
+        values = entry[1:5] if entry else (0, 0, 0, 0)
+        return dict(zip(OUTCOMES, values))
+
+    def win_rate(self, board, letter):
+        """Share of finished games through ``board`` that ``letter`` won."""
+        outcomes = self.outcomes(board)
+        finished = outcomes['X'] + outcomes['O'] + outcomes['tie']
+        return outcomes[letter] / finished if finished else 0.0
+
+    def games_through(self, board):
+        """Byte offsets of the indexed games that passed through ``board`` (or a symmetric board)."""
+        index, entry = self._entry(board)
+        return index.offsets(entry) if entry else []
+
+    def load_game(self, offset):
+        """Returns the game stored at ``offset`` as a TicTacToe."""
+        self.flush()
+        with open(self.path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                record, _ = decode_record(data, offset)
+        game = TicTacToe()
+        game.load_game_state(state_from_record(record))
+        return game
@@ -0,0 +1,113 @@
+"""
+Vectorized position evaluation for many 3x3 boards at once (requires NumPy).
+
+Boards are given as an (N, 9) array, either of square letters (' ', 'X', 'O')
+or already encoded as integers (0 = empty, 1 = X, 2 = O). Every function
+works on the whole batch with mask operations and agrees with the
+corresponding single-board TicTacToe method.
+"""
+
+# Developed by phoenix marie.
+import numpy as np
+
+EMPTY, X, O = 0, 1, 2
+CODES = {'X': X, 'O': O}
+
+# status codes returned by batch_status
+ONGOING, X_WINS, O_WINS, DRAW = 0, 1, 2, 3
+
+LINES = np.array([
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
+    [0, 4, 8], [2, 4, 6],  # Diagonals
+])
+
+# LINE_SQUARES[l, k, s] is 1 when the k-th square of line l is square s
+LINE_SQUARES = np.zeros((8, 3, 9), dtype=np.uint8)
+LINE_SQUARES[np.arange(8)[:, None], np.arange(3)[None, :], LINES] = 1
+
+
+def encode_boards(boards):
+    """Returns the boards as an (N, 9) uint8 array of EMPTY / X / O codes."""
+    boards = np.asarray(boards)
+    if boards.ndim == 1:
+        boards = boards[None, :]
+    if boards.ndim != 2 or boards.shape[1] != 9:
+        raise ValueError("Boards must have shape (N, 9).")
+    if boards.dtype.kind in 'US':
+        boards = boards.astype(str)
+        return ((boards == 'X') * X + (boards == 'O') * O).astype(np.uint8)
+    if boards.dtype.kind == 'O':
+        return encode_boards(boards.astype(str))
+    return boards.astype(np.uint8)
+
+
+def _letter_code(letter):
+    if letter not in CODES:
+        raise ValueError("Letter must be 'X' or 'O'.")
+    return CODES[letter]
+
+
+def batch_wins(boards, letter):
+    """Boolean array: does ``letter`` have three in a row on each board."""
+    boards = encode_boards(boards)
+    return (boards[:, LINES] == _letter_code(letter)).all(axis=2).any(axis=1)
+
+
+def batch_status(boards):
+    """
+    Classifies every board.
+
+    Returns:
+        np.ndarray: int8 array of ONGOING, X_WINS, O_WINS or DRAW per board.
+    """
+    boards = encode_boards(boards)
+    lines = boards[:, LINES]
+    x_wins = (lines == X).all(axis=2).any(axis=1)
+    o_wins = (lines == O).all(axis=2).any(axis=1)
+    full = (boards != EMPTY).all(axis=1)
+    status = np.full(len(boards), ONGOING, dtype=np.int8)
+    status[full] = DRAW
+    status[o_wins] = O_WINS
+    status[x_wins] = X_WINS
+    return status
+
+
+def batch_evaluate(boards, letter):
+    """Batch version of TicTacToe.evaluate_board: 1 if ``letter`` has won, -1 if the opponent has, else 0."""
+    other = 'O' if letter == 'X' else 'X'
+    boards = encode_boards(boards)
+    wins = batch_wins(boards, letter)
+    losses = batch_wins(boards, other)
+    return np.where(wins, 1, np.where(losses, -1, 0)).astype(np.int8)
+
+
+def batch_winning_moves(boards, letter):
+    """
+    Batch version of TicTacToe.get_potential_winning_moves.
+
+    Returns:
+        np.ndarray: (N, 9) boolean mask of the empty squares where ``letter``
+        completes a line. As on a single board, every empty square counts when
+        ``letter`` has already won.
+    """
+    code = _letter_code(letter)
+    boards = encode_boards(boards)
+    lines = boards[:, LINES]
+    empty_cells = lines == EMPTY
+    # lines holding two of ours and one empty square
+    completing = ((lines == code).sum(axis=2) == 2) & (empty_cells.sum(axis=2) == 1)
+    selected = (empty_cells & completing[:, :, None]).astype(np.uint8)
+    moves = np.einsum('nlk,lks->ns', selected, LINE_SQUARES) > 0
+    already_won = (lines == code).all(axis=2).any(axis=1)
+    return moves | (already_won[:, None] & (boards == EMPTY))
+
+
+def batch_blocking_moves(boards, letter):
+    """Batch version of TicTacToe.get_potential_blocking_moves: squares where the opponent would win."""
+    return batch_winning_moves(boards, 'O' if letter == 'X' else 'X')
+
+
+def moves_from_mask(mask):
+    """Converts an (N, 9) move mask into a list of square lists."""
+    return [np.flatnonzero(row).tolist() for row in np.asarray(mask)]
@@ -0,0 +1,215 @@
+"""
+Benchmarks for the engine hot paths.
+
+Times minimax, winner, available_moves, check_future_win and whole games in
+play() for every pairing of computer players, on the engine that game.py and
+player.py both front, plus the memory one live game takes with each board
+class. Seeds are pinned so repeated runs do the same work. Results are
+written as JSON, and a previous results file can be passed in to flag
+regressions.
+
+When the solved table (solved.py) is on disk, the smart player looks its
+moves up instead of searching, so the smart pairings then time table lookups
+rather than minimax; the 'solved_table' entry in the metadata records which
+case a results file is from. Without it, the shared transposition table is
+cleared before every repeat but stays warm across the games of one repeat,
+as it would in a real session. The mcts pairings play far fewer games, since
+every MCTS move runs a couple of thousand playouts.
+
+Usage:
+    python benchmarks.py --output bench.json
+    python benchmarks.py --compare bench.json --threshold 0.15
+"""
+
+# Developed by phoenix marie.
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from bitboard import BitboardTicTacToe
+from compact import CompactTicTacToe
+import engine
+import solved
+from transposition import TranspositionTable
+
+BOARD_CLASSES = {'list': engine.TicTacToe, 'bitboard': BitboardTicTacToe, 'compact': CompactTicTacToe}
+PAIRINGS = (('random', 'random'), ('random', 'smart'), ('smart', 'random'), ('smart', 'smart'),
+            ('random', 'mcts'), ('mcts', 'random'), ('smart', 'mcts'), ('mcts', 'smart'), ('mcts', 'mcts'))
+SEED = 1234
+
+# a mid-game position: X in the corner, O in the centre, X on the far edge
+MIDGAME_MOVES = ((0, 'X'), (4, 'O'), (7, 'X'))
+
+
+def make_game(board_class=engine.TicTacToe, moves=MIDGAME_MOVES):
+    state = board_class()
+    for square, letter in moves:
+        state.make_move(square, letter)
+    return state
+
+
+def time_call(func, number, repeat):
+    """Returns the best average seconds per call over ``repeat`` runs of ``number`` calls."""
+    best = None
+    for _ in range(repeat):
+        random.seed(SEED)
+        # every repeat starts from a cold cache, so later repeats don't just time cache hits
+        engine.SmartComputerPlayer.shared_table.clear()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = (time.perf_counter() - start) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench_minimax(number, repeat):
+    # a fresh transposition table per call, so every call does the full search
+    state = make_game(moves=MIDGAME_MOVES[:1])
+    return time_call(lambda: engine.SmartComputerPlayer('O', table=TranspositionTable()).minimax(state, 'O'),
+                     number, repeat)
+
+
+def bench_winner(number, repeat):
+    state = make_game()
+    return time_call(lambda: state.winner(7, 'X'), number, repeat)
+
+
+def bench_available_moves(number, repeat):
+    state = make_game()
+    return time_call(state.available_moves, number, repeat)
+
+
+def bench_check_future_win(number, repeat):
+    state = make_game()
+    return time_call(lambda: state.check_future_win('X', depth=2), number, repeat)
+
+
+def bench_play(x_type, o_type, number, repeat):
+    types = {'random': engine.RandomComputerPlayer, 'smart': engine.SmartComputerPlayer,
+             'mcts': engine.MCTSComputerPlayer}
+
+    def one_game():
+        engine.play(engine.TicTacToe(), types[x_type]('X'), types[o_type]('O'), print_game=False)
+
+    return time_call(one_game, number, repeat)
+
+
+def bench_memory(board_class, count):
+    """Returns the bytes allocated per live game, for ``count`` games stopped at the mid-game position."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        games = [make_game(board_class) for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(games)
+
+
+def run_benchmarks(quick=False):
+    """
+    Runs every benchmark.
+
+    Returns:
+        dict: 'meta' (environment details), 'results', mapping
+        "<module>.<benchmark>" to seconds per call and calls per second, and
+        'memory', mapping each board class to the bytes one live game takes.
+    """
+    scale = 0.1 if quick else 1.0
+    repeat = 3 if quick else 5
+
+    def calls(count):
+        return max(1, int(count * scale))
+
+    results = {}
+
+    def record(name, seconds):
+        results[name] = {'seconds_per_call': seconds, 'calls_per_second': 1 / seconds if seconds else None}
+
+    # names keep the 'engine.' prefix so older results files still compare
+    record('engine.minimax', bench_minimax(calls(5), repeat))
+    record('engine.winner', bench_winner(calls(100000), repeat))
+    record('engine.available_moves', bench_available_moves(calls(100000), repeat))
+    record('engine.check_future_win', bench_check_future_win(calls(2000), repeat))
+    for x_type, o_type in PAIRINGS:
+        games = calls(5) if 'mcts' in (x_type, o_type) else calls(2000)
+        record(f'engine.play.{x_type}_vs_{o_type}', bench_play(x_type, o_type, games, repeat))
+
+    memory = {name: {'bytes_per_game': bench_memory(board_class, calls(100000))}
+              for name, board_class in BOARD_CLASSES.items()}
+
+    meta = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'seed': SEED,
+        'quick': quick,
+        'solved_table': solved.load_table() is not None,  # smart moves come from the table when present
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    return {'meta': meta, 'results': results, 'memory': memory}
+
+
+def compare(current, baseline, threshold=0.10):
+    """
+    Compares two result sets.
+
+    Returns:
+        list: (name, baseline seconds, current seconds, relative change) for every
+        benchmark that got slower by more than ``threshold`` (0.10 = 10%).
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if not previous or not previous['seconds_per_call']:
+            continue
+        change = result['seconds_per_call'] / previous['seconds_per_call'] - 1
+        if change > threshold:
+            regressions.append((name, previous['seconds_per_call'], result['seconds_per_call'], change))
+    return regressions
+
+
+def print_results(current):
+    width = max(len(name) for name in current['results'])
+    for name, result in current['results'].items():
+        print(f"{name.ljust(width)}  {result['seconds_per_call'] * 1e6:12.2f} us/call"
+              f"  {result['calls_per_second']:14.1f} /s")
+    for name, result in current.get('memory', {}).items():
+        print(f"{('memory.' + name).ljust(width)}  {result['bytes_per_game']:12.1f} bytes/game")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Tic Tac Toe engine hot paths.")
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    parser.add_argument('--compare', help="JSON results of an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    parser.add_argument('--quick', action='store_true', help="run a tenth of the iterations")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(quick=args.quick)
+    print_results(current)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        for name, before, after, change in regressions:
+            print(f"REGRESSION {name}: {before * 1e6:.2f} -> {after * 1e6:.2f} us/call (+{change:.0%})")
+        if regressions:
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Bitboard implementation of the Tic Tac Toe board.
+
+Each side is packed into a 9-bit integer (bit i set means square i is taken),
+so win checks are a handful of mask comparisons and the empty squares are a
+table lookup instead of a fresh list comprehension on every call.
+"""
+
+# Developed by phoenix marie.
+import symmetry
+from engine import TicTacToe
+
+FULL_MASK = 0b111111111
+
+# rows, columns and diagonals as bitmasks
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # Rows
+    0b001001001, 0b010010010, 0b100100100,  # Columns
+    0b100010001, 0b001010100,  # Diagonals
+)
+
+# the win masks that pass through each square
+SQUARE_WIN_MASKS = tuple(
+    tuple(mask for mask in WIN_MASKS if mask & (1 << square)) for square in range(9)
+)
+
+# empty mask -> ordered list of empty squares / number of empty squares
+MOVES_BY_MASK = tuple(
+    tuple(square for square in range(9) if mask & (1 << square)) for mask in range(FULL_MASK + 1)
+)
+POPCOUNT = tuple(len(moves) for moves in MOVES_BY_MASK)
+
+
+class BitboardView():
+    """List-like view over the bitmasks of a BitboardTicTacToe.
+
+    Supports the subset of list behaviour the players rely on: indexing,
+    item assignment, slicing, iteration, ``count`` and ``in``.
+    """
+    __slots__ = ('game',)
+
+    def __init__(self, game):
+        self.game = game
+
+    def __len__(self):
+        return 9
+
+    def __getitem__(self, square):
+        if isinstance(square, slice):
+            return [self[i] for i in range(9)[square]]
+        bit = 1 << square
+        if self.game.x_bits & bit:
+            return 'X'
+        if self.game.o_bits & bit:
+            return 'O'
+        return ' '
+
+    def __setitem__(self, square, letter):
+        if not 0 <= square < 9:
+            raise IndexError("Board square out of range.")
+        self.game.set_square(square, letter)
+
+    def __iter__(self):
+        for square in range(9):
+            yield self[square]
+
+    def __contains__(self, letter):
+        return self.count(letter) > 0
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def count(self, letter):
+        if letter == 'X':
+            return POPCOUNT[self.game.x_bits]
+        if letter == 'O':
+            return POPCOUNT[self.game.o_bits]
+        if letter == ' ':
+            return POPCOUNT[FULL_MASK & ~(self.game.x_bits | self.game.o_bits)]
+        return 0
+
+    def copy(self):
+        return list(self)
+
+
+class BitboardTicTacToe(TicTacToe):
+    """Drop-in replacement for TicTacToe backed by two integer bitmasks."""
+    __slots__ = ('x_bits', 'o_bits')
+
+    def __init__(self):
+        self.x_bits = 0
+        self.o_bits = 0
+        super().__init__()
+
+    @property
+    def board(self):
+        return BitboardView(self)
+
+    @board.setter
+    def board(self, squares):
+        if isinstance(squares, BitboardView):
+            squares = list(squares)
+        if len(squares) != 9:
+            raise ValueError("Board must have 9 squares.")
+        self.x_bits = 0
+        self.o_bits = 0
+        for square, letter in enumerate(squares):
+            if letter != ' ':
+                self.set_square(square, letter)
+
+    def make_board(self):
+        self.x_bits = 0
+        self.o_bits = 0
+        return BitboardView(self)
+
+    def set_square(self, square, letter):
+        bit = 1 << square
+        self.x_bits &= ~bit
+        self.o_bits &= ~bit
+        if letter == 'X':
+            self.x_bits |= bit
+        elif letter == 'O':
+            self.o_bits |= bit
+        elif letter != ' ':
+            raise ValueError("Bitboard squares must be 'X', 'O' or ' '.")
+
+    def position_key(self):
+        return (self.x_bits, self.o_bits)
+
+    def canonical_form(self):
+        return symmetry.canonicalize_masks(self.x_bits, self.o_bits)
+
+    def empty_mask(self):
+        return FULL_MASK & ~(self.x_bits | self.o_bits)
+
+    def available_moves(self):
+        return list(MOVES_BY_MASK[FULL_MASK & ~(self.x_bits | self.o_bits)])
+
+    def empty_squares(self):
+        return (self.x_bits | self.o_bits) != FULL_MASK
+
+    def num_empty_squares(self):
+        return POPCOUNT[FULL_MASK & ~(self.x_bits | self.o_bits)]
+
+    def is_full(self):
+        return (self.x_bits | self.o_bits) == FULL_MASK
+
+    def make_move(self, square, letter, record=True):
+        bit = 1 << square
+        if (self.x_bits | self.o_bits) & bit:
+            return False
+        if letter == 'X':
+            self.x_bits |= bit
+        elif letter == 'O':
+            self.o_bits |= bit
+        else:
+            raise ValueError("Bitboard squares must be 'X', 'O' or ' '.")
+        if record:
+            self.move_history.append((square, letter))
+        if self.winner(square, letter):
+            self.current_winner = letter
+        return True
+
+    def undo_move(self):
+        if self.move_history:
+            last_move, last_letter = self.move_history.pop()
+            bit = ~(1 << last_move)
+            self.x_bits &= bit
+            self.o_bits &= bit
+            self.current_winner = None
+
+    def push_move(self, square, letter):
+        bit = 1 << square
+        if letter == 'X':
+            self.x_bits |= bit
+            bits = self.x_bits
+        else:
+            self.o_bits |= bit
+            bits = self.o_bits
+        self._undo_squares.append(square)
+        self._undo_winners.append(self.current_winner)
+        for mask in SQUARE_WIN_MASKS[square]:
+            if bits & mask == mask:
+                self.current_winner = letter
+                return True
+        return False
+
+    def pop_move(self):
+        bit = ~(1 << self._undo_squares.pop())
+        self.x_bits &= bit
+        self.o_bits &= bit
+        self.current_winner = self._undo_winners.pop()
+
+    def letter_bits(self, letter):
+        if letter == 'X':
+            return self.x_bits
+        if letter == 'O':
+            return self.o_bits
+        return 0
+
+    def winner(self, square, letter):
+        bits = self.letter_bits(letter)
+        for mask in SQUARE_WIN_MASKS[square]:
+            if bits & mask == mask:
+                return True
+        return False
+
+    def check_win(self, letter):
+        bits = self.letter_bits(letter)
+        for mask in WIN_MASKS:
+            if bits & mask == mask:
+                return True
+        return False
+
+    def find_winning_moves(self, letter):
+        """Squares where ``letter`` would have a line (every empty square if it already has one)."""
+        empty = FULL_MASK & ~(self.x_bits | self.o_bits)
+        if self.check_win(letter):
+            return list(MOVES_BY_MASK[empty])
+        bits = self.letter_bits(letter)
+        winning = 0
+        for mask in WIN_MASKS:
+            missing = mask & ~bits
+            # exactly one square of the line is missing and it is empty
+            if missing & empty == missing and POPCOUNT[missing] == 1:
+                winning |= missing
+        return list(MOVES_BY_MASK[winning])
+
+    def get_board_copy(self):
+        return list(self.board)
+
+    def get_empty_board_indices(self):
+        return self.available_moves()
+
+    def get_occupied_board_indices(self):
+        return {'X': list(MOVES_BY_MASK[self.x_bits]), 'O': list(MOVES_BY_MASK[self.o_bits])}
@@ -0,0 +1,176 @@
+"""
+Command line entry point.
+
+    python cli.py play [X player] [O player] [--games N] [--seed N] [--board list|bitboard|compact] [--quiet]
+                        [--record FILE]
+    python cli.py selfplay <simulate.py arguments>
+    python cli.py solve [table path]
+    python cli.py bench <benchmarks.py arguments>
+
+Players are human, random, smart, mcts or learned (default: smart against
+random); learned loads the value model written by learned.py.
+``play`` never prompts unless a human player is asked for; with --quiet it
+prints one result per game (X, O or tie) and nothing else. --record appends
+every game to a binary record file (see records.py) from a background thread.
+
+Every subcommand imports only what it needs: ``play`` loads the players and
+the board, while process pools, NumPy and argparse are left to the
+subcommands that use them, so a single game starts almost as fast as the bare
+interpreter. Orchestration that spawns many short-lived processes should call
+this module rather than game.py, whose main program is the interactive menu.
+"""
+
+# Developed by phoenix marie.
+import sys
+
+PLAYER_NAMES = ('human', 'random', 'smart', 'mcts', 'learned')
+BOARD_NAMES = ('list', 'bitboard', 'compact')
+
+
+def usage():
+    # the command summary at the top of the module docstring
+    return 'Usage:\n' + __doc__.strip().split('\n\n')[1]
+
+
+def make_player(name, letter):
+    if name == 'learned':
+        # the only player that needs NumPy
+        import learned
+        try:
+            return learned.ValuePlayer(letter)
+        except FileNotFoundError:
+            raise ValueError(f"no learned model at {learned.DEFAULT_PATH}; "
+                             f"train one with 'python learned.py' first") from None
+    import engine
+    classes = {
+        'human': engine.HumanPlayer,
+        'random': engine.RandomComputerPlayer,
+        'smart': engine.SmartComputerPlayer,
+        'mcts': engine.MCTSComputerPlayer,
+    }
+    return classes[name](letter)
+
+
+def parse_play_args(args):
+    """
+    Parses the ``play`` arguments without argparse, which costs more to import than the game itself.
+
+    Returns:
+        dict: 'x', 'o', 'games', 'seed', 'board', 'quiet' and 'record'.
+    """
+    options = {'x': None, 'o': None, 'games': 1, 'seed': None, 'board': 'list', 'quiet': False, 'record': None}
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        if arg == '--quiet':
+            options['quiet'] = True
+        elif arg in ('--games', '--seed', '--board', '--record'):
+            if not args:
+                raise ValueError(f"{arg} needs a value")
+            value = args.pop(0)
+            if arg == '--record':
+                options['record'] = value
+            elif arg == '--board':
+                if value not in BOARD_NAMES:
+                    raise ValueError(f"unknown board {value!r}, expected one of {', '.join(BOARD_NAMES)}")
+                options['board'] = value
+            else:
+                try:
+                    options[arg[2:]] = int(value)
+                except ValueError:
+                    raise ValueError(f"{arg} needs a number") from None
+        elif arg in PLAYER_NAMES and options['o'] is None:
+            options['o' if options['x'] is not None else 'x'] = arg
+        else:
+            raise ValueError(f"unexpected argument {arg!r}")
+    options['x'] = options['x'] or 'smart'
+    options['o'] = options['o'] or 'random'
+    if options['games'] < 1:
+        raise ValueError("--games must be at least 1")
+    return options
+
+
+def play_command(args):
+    try:
+        options = parse_play_args(args)
+    except ValueError as e:
+        print(f"play: {e}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    import random
+    import engine
+    if options['seed'] is not None:
+        random.seed(options['seed'])
+    if options['board'] == 'bitboard':
+        from bitboard import BitboardTicTacToe as board_class
+    elif options['board'] == 'compact':
+        from compact import CompactTicTacToe as board_class
+    else:
+        board_class = engine.TicTacToe
+    try:
+        x_player = make_player(options['x'], 'X')
+        o_player = make_player(options['o'], 'O')
+    except ValueError as e:
+        print(f"play: {e}", file=sys.stderr)
+        return 2
+
+    observers = []
+    if options['record'] is not None:
+        from events import QueueRecordWriter
+        observers.append(QueueRecordWriter(options['record']))
+
+    totals = {'X': 0, 'O': 0, 'tie': 0}
+    try:
+        for _ in range(options['games']):
+            result = engine.play(board_class(), x_player, o_player, print_game=not options['quiet'],
+                                 observers=observers)
+            result = result or 'tie'
+            totals[result] += 1
+            if options['quiet']:
+                print(result)
+    finally:
+        for observer in observers:
+            observer.close()
+    if not options['quiet'] and options['games'] > 1:
+        print(f"After {options['games']} games, X won {totals['X']} times, "
+              f"O won {totals['O']} times, and there were {totals['tie']} ties")
+    return 0
+
+
+def selfplay_command(args):
+    import simulate
+    simulate.main(args)
+    return 0
+
+
+def solve_command(args):
+    import solved
+    path = args[0] if args else solved.DEFAULT_PATH
+    count = solved.build_table(path)
+    print(f"Solved {count} positions, table written to {path}")
+    return 0
+
+
+def bench_command(args):
+    import benchmarks
+    return benchmarks.main(args)
+
+
+COMMANDS = {
+    'play': play_command,
+    'selfplay': selfplay_command,
+    'solve': solve_command,
+    'bench': bench_command,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print(usage(), file=sys.stderr)
+        return 0 if argv and argv[0] in ('-h', '--help') else 2
+    return COMMANDS[argv[0]](argv[1:])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+Compact game state for holding large numbers of live games.
+
+A CompactTicTacToe keeps its whole state in one bytearray: the 9 squares
+(0 empty, 1 X, 2 O) followed by one byte per recorded move (square in the
+low nibble, letter above it). With ``__slots__`` and no per-game lists,
+tuples or line counts, a game in progress takes a fraction of the memory of
+the list-backed TicTacToe (see the memory section of benchmarks.py), while
+still being a drop-in board for the players and play().
+"""
+
+# Developed by phoenix marie.
+from engine import TicTacToe
+from lines import LINES, SQUARE_LINES
+import symmetry
+
+LETTERS = ' XO'
+CODES = {' ': 0, 'X': 1, 'O': 2}
+NUM_SQUARES = 9
+
+
+class CompactBoardView():
+    """List-like view over the squares of a CompactTicTacToe (see bitboard.BitboardView)."""
+    __slots__ = ('game',)
+
+    def __init__(self, game):
+        self.game = game
+
+    def __len__(self):
+        return NUM_SQUARES
+
+    def __getitem__(self, square):
+        if isinstance(square, slice):
+            return [LETTERS[code] for code in self.game.data[:NUM_SQUARES][square]]
+        if not -NUM_SQUARES <= square < NUM_SQUARES:
+            raise IndexError("Board square out of range.")
+        return LETTERS[self.game.data[square % NUM_SQUARES]]
+
+    def __setitem__(self, square, letter):
+        if not 0 <= square < NUM_SQUARES:
+            raise IndexError("Board square out of range.")
+        self.game.data[square] = CODES[letter]
+
+    def __iter__(self):
+        data = self.game.data
+        for square in range(NUM_SQUARES):
+            yield LETTERS[data[square]]
+
+    def __contains__(self, letter):
+        return self.count(letter) > 0
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def count(self, letter):
+        if letter not in CODES:
+            return 0
+        return self.game.data.count(CODES[letter], 0, NUM_SQUARES)
+
+    def copy(self):
+        return list(self)
+
+
+class CompactTicTacToe(TicTacToe):
+    """Drop-in replacement for TicTacToe that stores the board and move history in one bytearray."""
+    __slots__ = ('data',)
+
+    def __init__(self):
+        self.data = bytearray(NUM_SQUARES)
+        self.current_winner = None
+        # the push_move/pop_move stacks are only created once a search needs them
+        self._undo_squares = None
+        self._undo_winners = None
+
+    @classmethod
+    def from_game_state(cls, game_state):
+        game = cls()
+        game.load_game_state(game_state)
+        return game
+
+    @property
+    def board(self):
+        return CompactBoardView(self)
+
+    @board.setter
+    def board(self, squares):
+        if len(squares) != NUM_SQUARES:
+            raise ValueError("Board must have 9 squares.")
+        self.data[:NUM_SQUARES] = bytes(CODES[letter] for letter in squares)
+
+    @property
+    def move_history(self):
+        return [(move & 0x0F, LETTERS[move >> 4]) for move in self.data[NUM_SQUARES:]]
+
+    @move_history.setter
+    def move_history(self, moves):
+        self.data[NUM_SQUARES:] = bytes(square | CODES[letter] << 4 for square, letter in moves)
+
+    def make_board(self):
+        return [' '] * NUM_SQUARES
+
+    def get_board_copy(self):
+        return [LETTERS[code] for code in self.data[:NUM_SQUARES]]
+
+    def position_key(self):
+        return bytes(self.data[:NUM_SQUARES])
+
+    def canonical_form(self):
+        return symmetry.canonicalize(self.get_board_copy())
+
+    def available_moves(self):
+        data = self.data
+        return [square for square in range(NUM_SQUARES) if not data[square]]
+
+    def empty_squares(self):
+        return 0 in self.data[:NUM_SQUARES]
+
+    def num_empty_squares(self):
+        return self.data.count(0, 0, NUM_SQUARES)
+
+    def is_full(self):
+        return not self.empty_squares()
+
+    def get_empty_board_indices(self):
+        return self.available_moves()
+
+    def make_move(self, square, letter, record=True):
+        if self.data[square]:
+            return False
+        code = CODES[letter]
+        self.data[square] = code
+        if record:
+            self.data.append(square | code << 4)
+        if self.winner(square, letter):
+            self.current_winner = letter
+        return True
+
+    def undo_move(self):
+        if len(self.data) > NUM_SQUARES:
+            self.data[self.data.pop() & 0x0F] = 0
+            self.current_winner = None
+
+    def push_move(self, square, letter):
+        if self._undo_squares is None:
+            self._undo_squares = []
+            self._undo_winners = []
+        self.data[square] = CODES[letter]
+        self._undo_squares.append(square)
+        self._undo_winners.append(self.current_winner)
+        if self.winner(square, letter):
+            self.current_winner = letter
+            return True
+        return False
+
+    def pop_move(self):
+        self.data[self._undo_squares.pop()] = 0
+        self.current_winner = self._undo_winners.pop()
+
+    def winner(self, square, letter):
+        data = self.data
+        code = CODES[letter]
+        for line in SQUARE_LINES[square]:
+            a, b, c = LINES[line]
+            if data[a] == code and data[b] == code and data[c] == code:
+                return True
+        return False
+
+    def check_win(self, letter):
+        data = self.data
+        code = CODES[letter]
+        for a, b, c in LINES:
+            if data[a] == code and data[b] == code and data[c] == code:
+                return True
+        return False
+
+    def find_winning_moves(self, letter):
+        """Squares where ``letter`` would have a line (every empty square if it already has one)."""
+        if self.check_win(letter):
+            return self.available_moves()
+        data = self.data
+        code = CODES[letter]
+        squares = set()
+        for line in LINES:
+            spots = [data[square] for square in line]
+            if spots.count(code) == 2 and 0 in spots:
+                squares.add(line[spots.index(0)])
+        return sorted(squares)
+
+    def get_game_state(self):
+        return {
+            'board': self.get_board_copy(),
+            'current_winner': self.current_winner,
+            'move_history': self.move_history,
+        }
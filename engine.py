@@ -0,0 +1,778 @@
+"""
+The Tic Tac Toe engine: the board, the players and the game loop.
+
+game.py (the interactive menu) and player.py are thin front ends over this
+module, so there is a single board core and a single set of players.
+
+Based on the Tic Tac Toe implementation by Kylie Ying
+(https://www.github.com/kying18).
+"""
+
+# Developed by phoenix marie.
+import math
+import random
+import time
+
+from events import NO_HOOKS, Hooks, PrintObserver
+from instrumentation import SearchStats
+from lines import LineCountBoard
+from search import AlphaBetaSearch
+import solved
+import symmetry
+from transposition import TranspositionTable
+
+
+class Player():
+    """Base class for a player."""
+    def __init__(self, letter: str):
+        """
+        Initializes a Player instance.
+
+        Args:
+            letter (str): The identifier for the player.
+        """
+        if not isinstance(letter, str) or len(letter) != 1:
+            raise ValueError("Player letter must be a single character string.")
+        self.letter = letter
+
+    def get_move(self, game):
+        """
+        Determines and returns the player's move in the given game.
+
+        Args:
+            game: The current game state or object.
+
+        Returns:
+            The player's chosen move. The specific type depends on the game.
+
+        Raises:
+            NotImplementedError: This method should be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement the get_move method.")
+
+
+class HumanPlayer(Player):
+    """Represents a human player."""
+    def __init__(self, letter):
+        super().__init__(letter)
+
+    def get_move(self, game):
+        valid_square = False
+        val = None
+        while not valid_square:
+            square = input(self.letter + f'\'s turn. Input move (0-{len(game.board) - 1}): ')
+            try:
+                val = int(square)
+                if val not in game.available_moves():
+                    raise ValueError
+                valid_square = True
+            except ValueError:
+                print('Invalid square. Try again.')
+        return val
+
+
+class RandomComputerPlayer(Player):
+    """Represents a computer player making random moves."""
+    def __init__(self, letter):
+        super().__init__(letter)
+
+    def get_move(self, game):
+        square = random.choice(game.available_moves())
+        return square
+
+
+class SmartComputerPlayer(Player):
+    """Represents a computer player using the minimax algorithm."""
+    shared_table = TranspositionTable()
+
+    def __init__(self, letter, table=None, algorithm='minimax', max_nodes=None, max_time=None, instrument=False,
+                 oracle=None, workers=1, parallel_depth=6, deadline_ms=None):
+        super().__init__(letter)
+        # searched positions are shared by every smart player (and every game)
+        # unless a private table is passed in
+        self.table = table if table is not None else SmartComputerPlayer.shared_table
+        # 'minimax' searches the full tree; 'alphabeta' prunes, and deepens
+        # iteratively within max_nodes / max_time (seconds) when either is given
+        if algorithm not in ('minimax', 'alphabeta'):
+            raise ValueError("Search algorithm must be 'minimax' or 'alphabeta'.")
+        self.algorithm = algorithm
+        self.max_nodes = max_nodes
+        self.max_time = max_time
+        # with instrument=True every move appends a SearchStats dict to move_stats
+        self.instrument = instrument
+        self.move_stats = []
+        self.stats = None
+        # a perfect-play table for other board sizes (e.g. a retrograde.RetrogradeTable);
+        # consulted whenever it matches the game being played
+        self.oracle = oracle
+        # with workers > 1, minimax hands every root move's subtree to a process
+        # pool once at least parallel_depth squares are empty
+        self.workers = workers
+        self.parallel_depth = parallel_depth
+        self._pool = None
+        # anytime mode: with deadline_ms every move is answered within that many
+        # milliseconds by deepening an alpha-beta search until time runs out;
+        # last_result holds the move, score, depth and whether it is proven
+        self.deadline_ms = deadline_ms
+        self.last_result = None
+
+    def get_move(self, game):
+        if not self.instrument:
+            return self.choose_move(game)
+        self.stats = SearchStats(len(game.move_history), self.letter)
+        start = time.perf_counter()
+        try:
+            square = self.choose_move(game)
+            self.stats.move = square
+        finally:
+            self.stats.elapsed = time.perf_counter() - start
+            self.move_stats.append(self.stats.as_dict())
+            self.stats = None
+        return square
+
+    def choose_move(self, game):
+        # every 3x3 opening draws, so the first move there is random; other
+        # boards can have losing openings and go to the oracle or the search
+        if _classic_board(game) and len(game.available_moves()) == len(game.board):
+            square = random.choice(game.available_moves())
+            source = 'random'
+            if self.deadline_ms is not None:
+                self.last_result = {'position': square, 'score': None, 'depth': 0, 'nodes': 0,
+                                    'proven': False, 'source': source}
+        elif self.deadline_ms is not None:
+            self.last_result = self.anytime_search(game, self.deadline_ms)
+            square = self.last_result['position']
+            source = self.last_result['source']
+        else:
+            square = self.solved_move(game)
+            source = 'table'
+            if square is None:  # no table on disk, fall back to a live search
+                square = self.search(game)['position']
+                source = self.algorithm
+        if self.stats is not None:
+            self.stats.source = source
+        return square
+
+    def search(self, game):
+        """Runs the selected search algorithm and returns its best move and score."""
+        if self.algorithm == 'alphabeta':
+            return AlphaBetaSearch(self.max_nodes, self.max_time, stats=self.stats).search(game, self.letter)
+        if self.workers > 1 and game.current_winner is None and game.num_empty_squares() >= self.parallel_depth:
+            return self.parallel_minimax(game)
+        return self.minimax(game, self.letter)
+
+    def anytime_search(self, game, deadline_ms):
+        """
+        Finds the best move that can be found within ``deadline_ms`` milliseconds.
+
+        A solved table or oracle answers at once. Otherwise alpha-beta deepens
+        one ply at a time and the last iteration that finished before the
+        deadline is kept; if not even the first one finishes, the best-ordered
+        move (a win or a block if there is one) is returned.
+
+        Returns:
+            dict: 'position', 'score' (for this player, None for table moves),
+            'depth', 'nodes', 'proven' (True when the move is known to be
+            optimal, i.e. it is exactly what minimax would play) and 'source'.
+        """
+        start = time.perf_counter()
+        square = self.solved_move(game)
+        if square is not None:
+            return {'position': square, 'score': None, 'depth': game.num_empty_squares(), 'nodes': 0,
+                    'proven': True, 'source': 'table'}
+        # whatever the table lookup took comes out of the search's budget
+        remaining = max(deadline_ms / 1000 - (time.perf_counter() - start), 0.0)
+        result = AlphaBetaSearch(max_time=remaining, stats=self.stats).search(game, self.letter)
+        result['source'] = 'anytime'
+        return result
+
+    def parallel_minimax(self, game):
+        """
+        Root-split minimax: every root move is searched in a worker process.
+
+        The root is combined exactly like minimax does it (first strictly
+        better move in square order), so the move and score are the same as
+        the serial search.
+        """
+        if self._pool is None:
+            # imported here so single-process use never pays for multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        moves = game.available_moves()
+        if self.stats is not None:
+            self.stats.nodes += 1
+            self.stats.expand(0, len(moves))
+        # the table itself stays in this process; workers build one of the same size
+        futures = [self._pool.submit(_minimax_worker, game, move, self.letter, self.stats is not None,
+                                     self.table.maxsize)
+                   for move in moves]
+        best = {'position': None, 'score': -math.inf}
+        for move, future in zip(moves, futures):
+            score, worker_stats = future.result()
+            if worker_stats is not None:
+                self.stats.merge(worker_stats)
+            if score > best['score']:
+                best = {'position': move, 'score': score}
+        return best
+
+    def close(self):
+        """Shuts down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def solved_move(self, game):
+        """Looks the best move up in the oracle or the solved-game table, if one is available."""
+        if game.current_winner is not None:
+            return None
+        if self.oracle is not None and self.oracle.matches(game):
+            if solved.side_to_move(game.board) != self.letter:
+                return None
+            return self.oracle.best_move(game.board)
+        if not _classic_board(game):
+            return None
+        table = solved.load_table()
+        if table is None or solved.side_to_move(game.board) != self.letter:
+            return None
+        return table.best_move(game.board)
+
+    def minimax(self, state, player, depth=0):
+        max_player = self.letter  # yourself
+        other_player = 'O' if player == 'X' else 'X'
+        stats = self.stats
+        if stats is not None:
+            stats.nodes += 1
+
+        # Base cases: check for winner or tie
+        if state.current_winner == other_player:
+            return {'position': None, 'score': 1 * (state.num_empty_squares() + 1) if other_player == max_player else -1 * (
+                        state.num_empty_squares() + 1)}
+        elif not state.empty_squares():
+            return {'position': None, 'score': 0}
+
+        # positions already searched for this side (and this max player) are reused;
+        # symmetric positions share an entry, so only the score is kept and the
+        # root is always expanded to pick the move itself
+        key = (state.canonical_key(), player, max_player)
+        if depth:
+            cached = self.table.get(key)
+            if stats is not None:
+                if cached is None:
+                    stats.cache_misses += 1
+                else:
+                    stats.cache_hits += 1
+            if cached is not None:
+                return {'position': None, 'score': cached}
+
+        if player == max_player:
+            best = {'position': None, 'score': -math.inf}  # Maximize score
+        else:
+            best = {'position': None, 'score': math.inf}  # Minimize score
+
+        moves = state.available_moves()
+        if stats is not None:
+            stats.expand(depth, len(moves))
+        for possible_move in moves:
+            state.push_move(possible_move, player)  # Simulate move
+            sim_score = self.minimax(state, other_player, depth + 1)  # Recursive call
+            state.pop_move()  # Undo move
+            sim_score['position'] = possible_move
+
+            if player == max_player:
+                if sim_score['score'] > best['score']:
+                    best = sim_score
+            else:
+                if sim_score['score'] < best['score']:
+                    best = sim_score
+        self.table.put(key, best['score'])
+        return best
+
+
+def _classic_board(game):
+    # the plain 3x3, three-in-a-row game (which the solved table covers)
+    return len(game.board) == 9 and (getattr(game, 'width', 3), getattr(game, 'win_length', 3)) == (3, 3)
+
+
+_minimax_players = {}
+
+
+def _minimax_worker(game, move, letter, instrument, table_size):
+    # runs in a worker process; the player (and its transposition table) is
+    # kept between tasks, so later searches in the same process reuse it. Every
+    # board configuration gets its own player and table of the parent's size.
+    key = (letter, table_size, getattr(game, 'width', 3), getattr(game, 'height', 3),
+           getattr(game, 'win_length', 3))
+    if key not in _minimax_players:
+        _minimax_players[key] = SmartComputerPlayer(letter, table=TranspositionTable(table_size))
+    player = _minimax_players[key]
+    player.stats = SearchStats(0, letter) if instrument else None
+    try:
+        game.push_move(move, letter)
+        score = player.minimax(game, 'O' if letter == 'X' else 'X', depth=1)['score']
+    finally:
+        stats, player.stats = player.stats, None
+    return score, stats
+
+
+class MCTSNode():
+    """A node of the Monte Carlo search tree: the position after ``letter`` played ``move``."""
+    __slots__ = ('move', 'letter', 'parent', 'children', 'untried', 'visits', 'wins')
+
+    def __init__(self, move, letter, parent, untried):
+        self.move = move
+        self.letter = letter
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0  # from the point of view of ``letter``
+
+    def select_child(self, exploration):
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+
+class MCTSComputerPlayer(Player):
+    """Represents a computer player using Monte Carlo Tree Search (UCT)."""
+    def __init__(self, letter, iterations=2000, max_time=None, exploration=1.4, workers=1, reuse_tree=True,
+                 instrument=False):
+        """
+        Initializes an MCTS player.
+
+        Args:
+            letter (str): The identifier for the player.
+            iterations (int): Playouts per move (per worker when running in parallel).
+            max_time (float, optional): Stop searching after this many seconds,
+                even if not all iterations have run.
+            exploration (float): UCT exploration constant.
+            workers (int): Worker processes; with more than one, each worker grows
+                its own tree and the root visit counts are summed.
+            reuse_tree (bool): Keep the subtree of the actual moves between calls.
+            instrument (bool): Append every move's search stats to move_stats.
+        """
+        super().__init__(letter)
+        if iterations < 1:
+            raise ValueError("MCTS needs at least one iteration per move.")
+        self.iterations = iterations
+        self.max_time = max_time
+        self.exploration = exploration
+        self.workers = workers
+        self.reuse_tree = reuse_tree
+        self.instrument = instrument
+        self.move_stats = []
+        self.root = None
+        self.root_board = None
+        self.nodes = 0
+        self.last_stats = {}
+        self._pool = None
+        self._rollout_players = {'X': RandomComputerPlayer('X'), 'O': RandomComputerPlayer('O')}
+
+    def get_move(self, game):
+        start = time.perf_counter()
+        if self.workers > 1:
+            counts, iterations, nodes = self.parallel_search(game)
+        else:
+            root = self.run(game, self.iterations, self.max_time)
+            counts = {child.move: child.visits for child in root.children}
+            iterations, nodes = root.visits, self.nodes
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            'iterations': iterations,
+            'nodes': nodes,
+            'elapsed': elapsed,
+            'nodes_per_second': nodes / elapsed if elapsed else 0.0,
+        }
+        # most visited move, lowest square on ties
+        square = max(sorted(counts), key=counts.get) if counts else random.choice(game.available_moves())
+        if self.instrument:
+            self.move_stats.append(dict(self.last_stats, ply=len(game.move_history), letter=self.letter,
+                                        move=square, source='mcts'))
+        return square
+
+    def run(self, game, iterations, max_time=None):
+        """Grows the search tree for the current position and returns its root."""
+        root = self.reused_root(game)
+        if root is None:
+            other = 'O' if self.letter == 'X' else 'X'
+            root = MCTSNode(None, other, None, game.available_moves())
+        self.root = root
+        self.root_board = game.get_board_copy()
+        self.nodes = 0
+
+        deadline = time.perf_counter() + max_time if max_time is not None else None
+        for iteration in range(max(iterations, 1)):
+            # the first playout always runs, so there is a move to return
+            if iteration and deadline is not None and time.perf_counter() > deadline:
+                break
+            self.playout(game, root)
+        return root
+
+    def playout(self, game, root):
+        played = 0
+        node = root
+        winner = None
+        try:
+            # selection
+            while not node.untried and node.children:
+                node = node.select_child(self.exploration)
+                game.push_move(node.move, node.letter)
+                played += 1
+                self.nodes += 1
+            if game.current_winner is None and node.untried:
+                # expansion
+                letter = 'O' if node.letter == 'X' else 'X'
+                move = node.untried.pop(random.randrange(len(node.untried)))
+                game.push_move(move, letter)
+                played += 1
+                self.nodes += 1
+                untried = [] if game.current_winner else game.available_moves()
+                child = MCTSNode(move, letter, node, untried)
+                node.children.append(child)
+                node = child
+            # simulation
+            letter = 'O' if node.letter == 'X' else 'X'
+            while game.current_winner is None and game.empty_squares():
+                move = self._rollout_players[letter].get_move(game)
+                game.push_move(move, letter)
+                played += 1
+                self.nodes += 1
+                letter = 'O' if letter == 'X' else 'X'
+            winner = game.current_winner
+        finally:
+            for _ in range(played):
+                game.pop_move()
+        # backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.letter:
+                node.wins += 1
+            node = node.parent
+
+    def reused_root(self, game):
+        """Finds the node for the current position in the previous tree, if it is there."""
+        if not self.reuse_tree or self.root is None or len(self.root_board) != len(game.board):
+            return None
+        board = game.board
+        changed = set()
+        for square, spot in enumerate(self.root_board):
+            if spot != board[square]:
+                if spot != ' ':
+                    return None  # not a continuation of the same game
+                changed.add(square)
+        node = self.root
+        while changed:
+            for child in node.children:
+                if child.move in changed and board[child.move] == child.letter:
+                    changed.discard(child.move)
+                    node = child
+                    break
+            else:
+                return None
+        if node.letter == self.letter:
+            return None  # it is not our turn in this position
+        node.parent = None
+        return node
+
+    def parallel_search(self, game):
+        if self._pool is None:
+            # imported here so single-process use never pays for multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        seeds = [random.getrandbits(32) for _ in range(self.workers)]
+        futures = [self._pool.submit(_mcts_worker, game, self.letter, self.iterations, self.max_time,
+                                     self.exploration, seed) for seed in seeds]
+        counts = {}
+        iterations = nodes = 0
+        for future in futures:
+            worker_counts, worker_iterations, worker_nodes = future.result()
+            for move, visits in worker_counts.items():
+                counts[move] = counts.get(move, 0) + visits
+            iterations += worker_iterations
+            nodes += worker_nodes
+        return counts, iterations, nodes
+
+    def close(self):
+        """Shuts down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def _mcts_worker(game, letter, iterations, max_time, exploration, seed):
+    # runs in a worker process: one independent tree, root visit counts back
+    random.seed(seed)
+    player = MCTSComputerPlayer(letter, iterations, max_time, exploration, reuse_tree=False)
+    root = player.run(game, iterations, max_time)
+    return {child.move: child.visits for child in root.children}, root.visits, player.nodes
+
+
+class TicTacToe():
+    """Represents the Tic Tac Toe game."""
+    __slots__ = ('_board', 'current_winner', 'move_history', '_undo_squares', '_undo_winners')
+
+    def __init__(self):
+        self.board = self.make_board()
+        self.current_winner = None
+        self.move_history = []  # Keep track of moves made
+        # undo stack for push_move/pop_move; never touches move_history
+        self._undo_squares = []
+        self._undo_winners = []
+
+    @property
+    def board(self):
+        return self._board
+
+    @board.setter
+    def board(self, squares):
+        # per-line piece counts follow every change to the squares (see lines.py)
+        self._board = LineCountBoard(squares)
+
+    def make_board(self):
+        return [' '] * 9
+
+    def print_board(self):
+        for row in [self.board[i*3:(i+1)*3] for i in range(3)]:
+            print('| ' + ' | '.join(row) + ' |')
+
+    @staticmethod
+    def print_board_nums():
+        number_board = [[str(i) for i in range(j*3, (j+1)*3)] for j in range(3)]
+        for row in number_board:
+            print('| ' + ' | '.join(row) + ' |')
+
+    def available_moves(self):
+        return [i for i, spot in enumerate(self._board) if spot == ' ']
+
+    def empty_squares(self):
+        return ' ' in self._board
+
+    def num_empty_squares(self):
+        return self.board.count(' ')
+
+    def make_move(self, square, letter, record=True):
+        if self._board[square] == ' ':
+            self._board[square] = letter
+            if record:
+                self.move_history.append((square, letter))
+            if self.winner(square, letter):
+                self.current_winner = letter
+            return True
+        return False
+
+    def undo_move(self):
+        if self.move_history:
+            last_move, last_letter = self.move_history.pop()
+            self.board[last_move] = ' '
+            self.current_winner = None
+
+    def push_move(self, square, letter):
+        """
+        Plays a move in place for search, without recording it in move_history.
+
+        The square must be empty. Every push_move is undone by a matching
+        pop_move, which also restores current_winner.
+
+        Returns:
+            bool: True if the move completes a line for ``letter``.
+        """
+        self._board[square] = letter
+        self._undo_squares.append(square)
+        self._undo_winners.append(self.current_winner)
+        if self.winner(square, letter):
+            self.current_winner = letter
+            return True
+        return False
+
+    def pop_move(self):
+        """Takes back the last move played with push_move."""
+        self._board[self._undo_squares.pop()] = ' '
+        self.current_winner = self._undo_winners.pop()
+
+    def winner(self, square, letter):
+        return self._board.completes_line(square, letter)
+
+    def get_board_copy(self):
+        return self.board[:]
+
+    def get_game_state(self):
+        """Returns the current state of the game as a dictionary."""
+        return {
+            'board': list(self.board),
+            'current_winner': self.current_winner,
+            'move_history': list(self.move_history)
+        }
+
+    def load_game_state(self, game_state):
+        """Loads a game state from a dictionary."""
+        if 'board' in game_state and len(game_state['board']) == 9:
+            self.board = list(game_state['board'])
+        if 'current_winner' in game_state:
+            self.current_winner = game_state['current_winner']
+        if 'move_history' in game_state:
+            self.move_history = list(game_state['move_history'])
+
+    def position_key(self):
+        """Returns a hashable key identifying the current arrangement of the board."""
+        return ''.join(self.board)
+
+    def canonical_form(self):
+        """Returns (key shared by all symmetric versions of the board, transform used)."""
+        return symmetry.canonicalize(self.board)
+
+    def canonical_key(self):
+        return self.canonical_form()[0]
+
+    def is_full(self):
+        return ' ' not in self.board
+
+    def is_tie(self):
+        return not self.empty_squares() and self.current_winner is None
+
+    def reset_board(self):
+        self.board = self.make_board()
+        self.current_winner = None
+        self.move_history = []
+        self._undo_squares = []
+        self._undo_winners = []
+
+    def get_winning_combinations(self):
+        return [
+            self.board[0:3], self.board[3:6], self.board[6:9],  # Rows
+            [self.board[i] for i in [0, 3, 6]], [self.board[i] for i in [1, 4, 7]], [self.board[i] for i in [2, 5, 8]],  # Columns
+            [self.board[i] for i in [0, 4, 8]], [self.board[i] for i in [2, 4, 6]]  # Diagonals
+        ]
+
+    def check_win(self, letter):
+        return self._board.has_line(letter)
+
+    def get_potential_winning_moves(self, letter):
+        return self.find_winning_moves(letter)
+
+    def find_winning_moves(self, letter):
+        """Squares where ``letter`` would have a line (every empty square if it already has one)."""
+        if self.check_win(letter):
+            return self.available_moves()
+        return self._board.winning_squares(letter)
+
+    def get_potential_blocking_moves(self, letter):
+        opponent_letter = 'O' if letter == 'X' else 'X'
+        return self.get_potential_winning_moves(opponent_letter)
+
+    def evaluate_board(self, maximizing_player):
+        if self.check_win(maximizing_player.letter):
+            return 1
+        elif self.check_win('O' if maximizing_player.letter == 'X' else 'X'):
+            return -1
+        elif self.is_full():
+            return 0
+        else:
+            return 0
+
+    def get_empty_board_indices(self):
+        return [i for i, spot in enumerate(self._board) if spot == ' ']
+
+    def get_occupied_board_indices(self):
+        occupied = {'X': [], 'O': []}
+        for i, spot in enumerate(self.board):
+            if spot == 'X':
+                occupied['X'].append(i)
+            elif spot == 'O':
+                occupied['O'].append(i)
+        return occupied
+
+    def display_move_history(self):
+        """Prints the history of moves made in the current game."""
+        if self.move_history:
+            print("\n--- Move History ---")
+            for move, player in self.move_history:
+                print(f"Player {player} moved to square {move}")
+        else:
+            print("No moves have been made yet.")
+
+    def print_move_history(self):
+        if not self.move_history:
+            print("No moves have been made yet.")
+        else:
+            print("Move History:")
+            for move, letter in self.move_history:
+                print(f"Player {letter} moved to square {move}")
+
+    def check_future_win(self, letter, depth=2):
+        if depth == 0:
+            return False
+
+        opponent_letter = 'O' if letter == 'X' else 'X'
+        for move in self.available_moves():
+            self.push_move(move, letter)
+            try:
+                if self.check_win(letter):
+                    return True
+                can_opponent_block_future_win = False
+                for opponent_move in self.available_moves():
+                    self.push_move(opponent_move, opponent_letter)
+                    threats = self.find_winning_moves(letter)
+                    self.pop_move()
+                    if threats:
+                        can_opponent_block_future_win = True
+                        break
+                if not can_opponent_block_future_win and self.empty_squares():
+                    return self.check_future_win(letter, depth - 1)
+            finally:
+                self.pop_move()
+        return False
+
+
+def play(game, x_player, o_player, print_game=True, delay=0, observers=()):
+    """
+    Plays a game to the end, X first (a game already in progress goes on
+    with the side to move).
+
+    Args:
+        game: The board to play on.
+        x_player: Player for 'X'.
+        o_player: Player for 'O'.
+        print_game (bool): Print the board after every move.
+        delay (float): Seconds to pause after every move while printing, so a
+            watcher can follow the game.
+        observers (iterable of events.GameObserver): Told about every move,
+            invalid move and the end of the game.
+
+    Returns:
+        str: The winning letter, or None for a tie.
+    """
+    if print_game:
+        observers = (PrintObserver(delay),) + tuple(observers)
+    hooks = Hooks(observers) if observers else NO_HOOKS
+    for hook in hooks.game_started:
+        hook(game)
+
+    # a loaded game carries on with whoever is next, not necessarily X
+    history = game.move_history
+    if history:
+        letter = 'O' if history[-1][1] == 'X' else 'X'
+    else:
+        letter = solved.side_to_move(game.board)
+    while game.empty_squares() and not game.current_winner:
+        if letter == 'O':
+            square = o_player.get_move(game)
+        else:
+            square = x_player.get_move(game)
+
+        if game.make_move(square, letter):
+            for hook in hooks.move_made:
+                hook(game, letter, square)
+            if game.current_winner:
+                break
+            letter = 'O' if letter == 'X' else 'X'
+        else:
+            if isinstance(x_player, HumanPlayer) and letter == 'X' or isinstance(o_player, HumanPlayer) and letter == 'O':
+                print('That square is already taken. Try again.')
+            for hook in hooks.invalid_move:
+                hook(game, letter, square)
+
+    for hook in hooks.game_over:
+        hook(game, game.current_winner)
+    return game.current_winner  # None for a tie
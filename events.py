@@ -0,0 +1,161 @@
+"""
+Observers for the play() loop.
+
+play() reports what happens in a game to a list of observers instead of
+printing it itself. An observer subclasses GameObserver and overrides only
+the events it cares about:
+
+    game_started(game)                 before the first move
+    move_made(game, letter, square)    after every accepted move
+    invalid_move(game, letter, square) when a player picks a taken square
+    game_over(game, winner)            once, with 'X', 'O' or None for a tie
+
+Hooks collects the overridden methods once per game, so an event nobody
+listens to costs an empty loop and a headless game with no observers calls
+nothing at all. Observers that do real work (logging, statistics, storage)
+should keep it off the game thread; QueueRecordWriter shows the pattern by
+handing finished games to a background thread that writes them in batches.
+"""
+
+# Developed by phoenix marie.
+import time
+
+EVENTS = ('game_started', 'move_made', 'invalid_move', 'game_over')
+
+
+class GameObserver():
+    """Base class for play() observers; every event is ignored unless overridden."""
+    def game_started(self, game):
+        pass
+
+    def move_made(self, game, letter, square):
+        pass
+
+    def invalid_move(self, game, letter, square):
+        pass
+
+    def game_over(self, game, winner):
+        pass
+
+
+class Hooks():
+    """The handlers of a list of observers, grouped by event."""
+    __slots__ = EVENTS
+
+    def __init__(self, observers=()):
+        for event in EVENTS:
+            default = getattr(GameObserver, event)
+            # skip the inherited no-ops so unused events cost nothing per move
+            handlers = tuple(getattr(observer, event) for observer in observers
+                             if getattr(type(observer), event, default) is not default)
+            setattr(self, event, handlers)
+
+
+NO_HOOKS = Hooks()
+
+
+class PrintObserver(GameObserver):
+    """Prints the game as it is played (what play() does with print_game=True)."""
+    def __init__(self, delay=0):
+        """
+        Initializes the observer.
+
+        Args:
+            delay (float): Seconds to pause after every move, so a watcher can
+                follow the game.
+        """
+        self.delay = delay
+
+    def game_started(self, game):
+        game.print_board_nums()
+
+    def move_made(self, game, letter, square):
+        print(f"{letter} makes a move to square {square}")
+        game.print_board()
+        print('')
+        if self.delay and not game.current_winner:
+            time.sleep(self.delay)
+
+    def invalid_move(self, game, letter, square):
+        if self.delay:
+            time.sleep(self.delay)
+
+    def game_over(self, game, winner):
+        if winner:
+            print(f"{winner} wins!")
+        elif game.is_tie():
+            print("It's a tie!")
+
+
+class QueueRecordWriter(GameObserver):
+    """
+    Appends every finished game to a binary record file (see records.py) from a background thread.
+
+    The game thread only builds the game's record (so a game the format
+    cannot hold, e.g. on a bigger board, fails right there) and puts it on a
+    queue; encoding and the buffered file writes happen on the writer thread,
+    which drains whatever has queued up in one go. Call close() (or use the
+    writer as a context manager) to flush the remaining games; it raises if
+    the writer thread failed.
+    """
+    def __init__(self, path, buffer_size=1 << 16):
+        # imported here so play() itself never pays for threads or the record format
+        import queue
+        import threading
+        from records import RecordWriter, record_from_state
+        self.path = path
+        self.record_from_state = record_from_state
+        self.queue = queue.SimpleQueue()
+        self.writer = RecordWriter(path, buffer_size)
+        self.error = None  # what stopped the writer thread, if anything
+        self.thread = threading.Thread(target=self._run, name='record-writer', daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def game_over(self, game, winner):
+        self.check()
+        self.queue.put(self.record_from_state(game.get_game_state()))
+
+    def check(self):
+        """Raises if the writer thread has stopped with an error."""
+        if self.error is not None:
+            raise RuntimeError(f"Writing game records to {self.path} failed.") from self.error
+
+    def _run(self):
+        import queue
+        try:
+            while True:
+                records = [self.queue.get()]
+                # take everything else that is waiting before going back to sleep
+                try:
+                    while True:
+                        records.append(self.queue.get_nowait())
+                except queue.Empty:
+                    pass
+                for record in records:
+                    if record is None:
+                        self.writer.flush()
+                        return
+                    self.writer.write(record)
+        except Exception as e:
+            self.error = e
+
+    @property
+    def count(self):
+        """Games written so far."""
+        return self.writer.count
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        if self.error is None:
+            self.writer.close()
+        else:
+            self.writer.file.close()  # don't flush what the failed thread left behind
+        self.check()
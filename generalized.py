@@ -0,0 +1,167 @@
+"""
+Generalized Tic Tac Toe: any width and height, K in a row to win.
+
+Squares are numbered row by row from 0, exactly like the 3x3 game, so the
+existing players and play() work unchanged. Only the lines through the last
+move are scanned to detect a win, and the set of empty squares is maintained
+as moves are made instead of re-enumerating the board.
+"""
+
+# Developed by phoenix marie.
+from engine import TicTacToe
+
+# right, down, down-right, down-left
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class TrackedBoard(list):
+    """List of squares that keeps a set of the empty ones in step with every assignment."""
+    __slots__ = ('empty',)
+
+    def __init__(self, squares):
+        super().__init__(squares)
+        self.empty = {square for square, letter in enumerate(self) if letter == ' '}
+
+    def __setitem__(self, square, letter):
+        super().__setitem__(square, letter)
+        if isinstance(square, slice):
+            self.empty = {i for i, spot in enumerate(self) if spot == ' '}
+        elif letter == ' ':
+            self.empty.add(square)
+        else:
+            self.empty.discard(square)
+
+
+class GeneralizedTicTacToe(TicTacToe):
+    """Tic Tac Toe on a width x height board where win_length in a row wins."""
+    __slots__ = ('width', 'height', 'win_length', 'size')
+
+    def __init__(self, width=3, height=3, win_length=3):
+        """
+        Initializes an empty board.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            win_length (int): Pieces in a row (horizontally, vertically or
+                diagonally) needed to win.
+        """
+        if width < 1 or height < 1:
+            raise ValueError("Board width and height must be positive.")
+        if not 1 <= win_length <= max(width, height):
+            raise ValueError("Win length must fit on the board.")
+        self.width = width
+        self.height = height
+        self.win_length = win_length
+        self.size = width * height
+        super().__init__()
+
+    @property
+    def board(self):
+        return self._board
+
+    @board.setter
+    def board(self, squares):
+        if len(squares) != self.size:
+            raise ValueError(f"Board must have {self.size} squares.")
+        self._board = TrackedBoard(squares)
+
+    def make_board(self):
+        return [' '] * self.size
+
+    def print_board(self):
+        cell = len(str(self.size - 1))
+        for row in range(self.height):
+            squares = self.board[row * self.width:(row + 1) * self.width]
+            print('| ' + ' | '.join(spot.center(cell) for spot in squares) + ' |')
+
+    def print_board_nums(self):
+        cell = len(str(self.size - 1))
+        for row in range(self.height):
+            numbers = range(row * self.width, (row + 1) * self.width)
+            print('| ' + ' | '.join(str(i).rjust(cell) for i in numbers) + ' |')
+
+    def available_moves(self):
+        return sorted(self._board.empty)
+
+    def empty_squares(self):
+        return bool(self._board.empty)
+
+    def num_empty_squares(self):
+        return len(self._board.empty)
+
+    def is_full(self):
+        return not self._board.empty
+
+    def get_empty_board_indices(self):
+        return self.available_moves()
+
+    def winner(self, square, letter):
+        board = self._board
+        width, height = self.width, self.height
+        row, col = divmod(square, width)
+        for d_row, d_col in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * d_row, col + sign * d_col
+                while 0 <= r < height and 0 <= c < width and board[r * width + c] == letter:
+                    count += 1
+                    if count >= self.win_length:
+                        return True
+                    r += sign * d_row
+                    c += sign * d_col
+            if count >= self.win_length:
+                return True
+        return False
+
+    def winning_lines(self):
+        """Returns every run of win_length squares as a list of square indices."""
+        lines = []
+        for row in range(self.height):
+            for col in range(self.width):
+                for d_row, d_col in DIRECTIONS:
+                    end_row = row + d_row * (self.win_length - 1)
+                    end_col = col + d_col * (self.win_length - 1)
+                    if 0 <= end_row < self.height and 0 <= end_col < self.width:
+                        lines.append([(row + d_row * i) * self.width + col + d_col * i
+                                      for i in range(self.win_length)])
+        return lines
+
+    def get_winning_combinations(self):
+        return [[self.board[i] for i in line] for line in self.winning_lines()]
+
+    def check_win(self, letter):
+        board = self._board
+        for square, spot in enumerate(board):
+            if spot == letter and self.winner(square, letter):
+                return True
+        return False
+
+    def find_winning_moves(self, letter):
+        """Squares where ``letter`` would have a line (every empty square if it already has one)."""
+        already_won = self.check_win(letter)
+        winning_moves = []
+        for move in self.available_moves():
+            if self.push_move(move, letter) or already_won:
+                winning_moves.append(move)
+            self.pop_move()
+        return winning_moves
+
+    def canonical_form(self):
+        # the 3x3 symmetry tables don't apply, so every position is its own canonical
+        # form; the board configuration is part of the key, since boards with the same
+        # number of squares but other dimensions or win lengths share transposition tables
+        return (self.width, self.height, self.win_length, self.position_key()), 0
+
+    def get_game_state(self):
+        game_state = super().get_game_state()
+        game_state.update(width=self.width, height=self.height, win_length=self.win_length)
+        return game_state
+
+    def load_game_state(self, game_state):
+        if 'board' in game_state and len(game_state['board']) == self.size:
+            self.board = list(game_state['board'])
+        if 'current_winner' in game_state:
+            self.current_winner = game_state['current_winner']
+        if 'move_history' in game_state:
+            self.move_history = list(game_state['move_history'])
@@ -0,0 +1,86 @@
+"""
+Opt-in search instrumentation for the computer players.
+
+A player created with ``instrument=True`` collects a SearchStats for every move
+it makes: nodes visited, transposition-table hits and misses, the branching
+factor at each depth, where the move came from and the wall time it took.
+Players that are not instrumented carry no stats object and skip all of this.
+"""
+
+# Developed by phoenix marie.
+
+
+class SearchStats():
+    """Counters for the search behind a single move."""
+    __slots__ = ('ply', 'letter', 'source', 'move', 'elapsed', 'nodes', 'cache_hits',
+                 'cache_misses', 'expanded', 'children', 'depth')
+
+    def __init__(self, ply, letter):
+        self.ply = ply  # number of moves already in the game's move_history
+        self.letter = letter
+        self.source = None  # 'random', 'table' or the search algorithm
+        self.move = None
+        self.elapsed = 0.0
+        self.nodes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.expanded = []  # nodes expanded at each depth
+        self.children = []  # children generated at each depth
+        self.depth = 0  # deepest ply searched
+
+    def expand(self, depth, num_children):
+        """Records a node at ``depth`` (0 = root) being expanded into ``num_children`` moves."""
+        while len(self.expanded) <= depth:
+            self.expanded.append(0)
+            self.children.append(0)
+        self.expanded[depth] += 1
+        self.children[depth] += num_children
+        if depth + 1 > self.depth:
+            self.depth = depth + 1
+
+    def merge(self, other):
+        """Adds in the counters of a search run elsewhere, such as a subtree searched in a worker process."""
+        self.nodes += other.nodes
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        for depth, (expanded, children) in enumerate(zip(other.expanded, other.children)):
+            if expanded:
+                while len(self.expanded) <= depth:
+                    self.expanded.append(0)
+                    self.children.append(0)
+                self.expanded[depth] += expanded
+                self.children[depth] += children
+        self.depth = max(self.depth, other.depth)
+
+    def branching_factors(self):
+        return [children / expanded for expanded, children in zip(self.expanded, self.children)]
+
+    def as_dict(self):
+        return {
+            'ply': self.ply,
+            'letter': self.letter,
+            'move': self.move,
+            'source': self.source,
+            'elapsed': self.elapsed,
+            'nodes': self.nodes,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'depth': self.depth,
+            'branching_factors': self.branching_factors(),
+        }
+
+
+def game_report(game, *players):
+    """
+    Returns the game state together with the search stats of the given players.
+
+    The result is ``game.get_game_state()`` plus a 'search_stats' list with one
+    entry per instrumented move, ordered by ply so it lines up with
+    'move_history'.
+    """
+    report = game.get_game_state()
+    search_stats = []
+    for player in players:
+        search_stats.extend(getattr(player, 'move_stats', []))
+    report['search_stats'] = sorted(search_stats, key=lambda stats: stats['ply'])
+    return report
@@ -0,0 +1,251 @@
+"""
+A computer player that learns position values from self-play (requires NumPy).
+
+The model is one value per canonical 3x3 board (symmetry.canonical_code, so
+all 8 symmetric versions of a position share an entry), seen from X: +1 is a
+win for X, -1 a win for O. A ValuePlayer looks at the board after each of its
+legal moves and takes the best value for its letter, so picking a move is a
+handful of table lookups however much training went into the table.
+
+Training plays batches of self-play games through engine.play() with some
+exploration, then updates every position the batch visited at once: the
+target of a position is the best value the side to move can reach from it
+(a Q-learning style TD backup), computed for the whole batch with array
+operations. validate() checks the result against the solved game: the player
+must never choose a move that minimax scores worse than its best one, and must
+not lose a single game against any sequence of opponent moves.
+
+Usage:
+    python learned.py --games 20000
+"""
+
+# Developed by phoenix marie.
+import argparse
+import os
+import random
+
+import numpy as np
+
+import batch
+from engine import Player, TicTacToe, play
+import symmetry
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tictactoe_value.npy')
+NUM_CODES = 3 ** 9
+# WEIGHTS[s, t] is the base-3 place value of square s in transformed board t
+WEIGHTS = np.array(symmetry.SQUARE_WEIGHTS, dtype=np.int64).T
+LETTER_CODES = {'X': batch.X, 'O': batch.O}
+
+
+def all_boards():
+    """Every base-3 code as an (NUM_CODES, 9) array of EMPTY / X / O codes."""
+    codes = np.arange(NUM_CODES)
+    return (codes[:, None] // 3 ** np.arange(9) % 3).astype(np.uint8)
+
+
+def canonical_codes(boards):
+    """Vectorized symmetry.canonical_code for an (N, 9) array of square codes."""
+    return (boards.astype(np.int64) @ WEIGHTS).min(axis=1)
+
+
+class ValueModel():
+    """The value table, with terminal positions fixed to their result."""
+    def __init__(self, values=None):
+        status = batch.batch_status(all_boards())
+        # finished games keep their true value; training only moves the rest
+        self.terminal = status != batch.ONGOING
+        self.outcomes = np.where(status == batch.X_WINS, 1.0, np.where(status == batch.O_WINS, -1.0, 0.0))
+        if values is None:
+            values = self.outcomes.copy()
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != (NUM_CODES,):
+            raise ValueError(f"A value model has {NUM_CODES} entries.")
+        self.values = values
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        return cls(np.load(path))
+
+    def save(self, path=DEFAULT_PATH):
+        # np.save appends .npy to paths without it, so open the file ourselves
+        with open(path, 'wb') as f:
+            np.save(f, self.values)
+
+    def value(self, board):
+        """Value for X of a single board (a list of letters)."""
+        return self.values[symmetry.canonical_code(board)]
+
+    def update(self, boards, alpha):
+        """
+        One batched TD backup over every unfinished position in ``boards``.
+
+        Args:
+            boards (np.ndarray): (N, 9) square codes; repeated positions are averaged.
+            alpha (float): Step size towards the backed-up value.
+        """
+        codes = canonical_codes(boards)
+        keep = ~self.terminal[codes]
+        boards, codes = boards[keep], codes[keep]
+        if not len(codes):
+            return
+        # X moves when both letters have the same number of pieces
+        x_to_move = (boards == batch.X).sum(axis=1) == (boards == batch.O).sum(axis=1)
+        mover = np.where(x_to_move, batch.X, batch.O).astype(np.uint8)
+        # the value after each of the 9 possible moves, for every board at once
+        children = np.repeat(boards[:, None, :], 9, axis=1)
+        squares = np.arange(9)
+        children[:, squares, squares] = mover[:, None]
+        child_values = self.values[canonical_codes(children.reshape(-1, 9))].reshape(-1, 9)
+        legal = boards == batch.EMPTY
+        targets = np.where(x_to_move,
+                           np.where(legal, child_values, -np.inf).max(axis=1),
+                           np.where(legal, child_values, np.inf).min(axis=1))
+        # average the targets of positions that appear more than once in the batch
+        unique, inverse = np.unique(codes, return_inverse=True)
+        sums = np.bincount(inverse, weights=targets)
+        counts = np.bincount(inverse)
+        self.values[unique] += alpha * (sums / counts - self.values[unique])
+
+
+class ValuePlayer(Player):
+    """Represents a computer player that picks moves from a learned value table."""
+    def __init__(self, letter, model=None, epsilon=0.0):
+        """
+        Initializes the player.
+
+        Args:
+            letter (str): 'X' or 'O'.
+            model (ValueModel, optional): The value table; loaded from DEFAULT_PATH if not given.
+            epsilon (float): Chance of playing a random move instead (used during training).
+        """
+        super().__init__(letter)
+        self.model = model if model is not None else ValueModel.load()
+        self.epsilon = epsilon
+        # X maximizes the table's values, O minimizes them
+        self.sign = 1.0 if letter == 'X' else -1.0
+
+    def get_move(self, game):
+        moves = game.available_moves()
+        if self.epsilon and random.random() < self.epsilon:
+            return random.choice(moves)
+        board = game.get_board_copy()
+        values = self.model.values
+        best_move, best_value = None, None
+        for square in moves:
+            board[square] = self.letter
+            value = self.sign * values[symmetry.canonical_code(board)]
+            board[square] = ' '
+            # first move in square order wins ties, like the other players
+            if best_value is None or value > best_value:
+                best_move, best_value = square, value
+        return best_move
+
+
+def game_boards(game):
+    """Square codes of every position the game went through, after each move."""
+    board = np.zeros(9, dtype=np.uint8)
+    boards = []
+    for square, letter in game.move_history:
+        board[square] = LETTER_CODES[letter]
+        boards.append(board.copy())
+    return boards
+
+
+def train(model=None, games=20000, batch_size=500, alpha=0.5, epsilon=0.3, seed=None):
+    """
+    Trains a value model from self-play.
+
+    Args:
+        model (ValueModel, optional): Model to keep training; a fresh one if not given.
+        games (int): Number of self-play games.
+        batch_size (int): Games played between two batched updates.
+        alpha (float): Step size of the updates.
+        epsilon (float): Exploration rate of both players.
+        seed (int, optional): Seed for reproducible training.
+
+    Returns:
+        ValueModel: The trained model.
+    """
+    if seed is not None:
+        random.seed(seed)
+    model = model if model is not None else ValueModel()
+    x_player = ValuePlayer('X', model, epsilon)
+    o_player = ValuePlayer('O', model, epsilon)
+    played = 0
+    while played < games:
+        boards = []
+        for _ in range(min(batch_size, games - played)):
+            game = TicTacToe()
+            # both players share the model, so X and O learn from every game
+            play(game, x_player, o_player, print_game=False)
+            boards.extend(game_boards(game))
+            played += 1
+        # the empty board is the one position no move leads to
+        boards.append(np.zeros(9, dtype=np.uint8))
+        model.update(np.array(boards), alpha)
+    return model
+
+
+def validate(model, letters=('X', 'O')):
+    """
+    Checks a model against the solved game.
+
+    Every position the learned player can reach, against any sequence of
+    opponent moves, is visited. A position counts as a mistake when the
+    chosen move has a worse minimax result (win, draw or loss) than the best
+    move there, and every finished game the player lost is counted.
+
+    Returns:
+        dict: 'positions' (decisions checked), 'mistakes' and 'losses'.
+    """
+    import analysis
+    result = {'positions': 0, 'mistakes': 0, 'losses': 0}
+    for letter in letters:
+        player = ValuePlayer(letter, model)
+        other = 'O' if letter == 'X' else 'X'
+
+        def visit(game, to_move):
+            if game.current_winner is not None or not game.empty_squares():
+                if game.current_winner == other:
+                    result['losses'] += 1
+                return
+            if to_move == letter:
+                scores = analysis.move_scores(game.get_board_copy())
+                move = player.get_move(game)
+                result['positions'] += 1
+                if np.sign(scores[move]) < np.sign(max(scores.values())):
+                    result['mistakes'] += 1
+                moves = [move]
+            else:
+                moves = game.available_moves()
+            for move in moves:
+                game.make_move(move, to_move)
+                visit(game, other if to_move == letter else letter)
+                game.undo_move()
+
+        visit(TicTacToe(), 'X')
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train a learned value player from self-play.")
+    parser.add_argument('--games', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--alpha', type=float, default=0.5)
+    parser.add_argument('--epsilon', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--model', default=DEFAULT_PATH, help="model file to write (default: next to this module)")
+    parser.add_argument('--resume', action='store_true', help="keep training the existing model file")
+    args = parser.parse_args(argv)
+
+    model = ValueModel.load(args.model) if args.resume else None
+    model = train(model, args.games, args.batch_size, args.alpha, args.epsilon, args.seed)
+    model.save(args.model)
+    report = validate(model)
+    print(f"Model written to {args.model}: {report['mistakes']} mistakes in {report['positions']} "
+          f"positions, {report['losses']} losses against every opponent line")
+    return 0 if report['mistakes'] == 0 and report['losses'] == 0 else 1
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Line-membership tables and incremental line counts for the 3x3 board.
+
+Every square belongs to two to four of the eight winning lines. The board
+keeps, for each letter, how many of its pieces sit on every line, updating
+only the lines through a square when that square changes. A win is then a
+count of 3 on a line through the last move, and an immediate win (or a
+threat to block) is a line where one letter has 2 pieces and the other none.
+"""
+
+# Developed by phoenix marie.
+
+LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+    (0, 4, 8), (2, 4, 6),  # Diagonals
+)
+# SQUARE_LINES[s] holds the indices of the lines through square s
+SQUARE_LINES = tuple(
+    tuple(index for index, line in enumerate(LINES) if square in line) for square in range(9)
+)
+OTHER = {'X': 'O', 'O': 'X'}
+
+
+class LineCountBoard(list):
+    """List of 9 squares that keeps per-line piece counts in step with every assignment."""
+    __slots__ = ('counts',)
+
+    def __init__(self, squares=(' ',) * 9):
+        super().__init__(squares)
+        self.recount()
+
+    def recount(self):
+        self.counts = {'X': [0] * len(LINES), 'O': [0] * len(LINES)}
+        for square, letter in enumerate(self):
+            if letter in self.counts:
+                for line in SQUARE_LINES[square]:
+                    self.counts[letter][line] += 1
+
+    def __setitem__(self, square, letter):
+        if isinstance(square, slice):
+            super().__setitem__(square, letter)
+            self.recount()
+            return
+        old = self[square]
+        super().__setitem__(square, letter)
+        counts = self.counts
+        if old in counts:
+            old_counts = counts[old]
+            for line in SQUARE_LINES[square]:
+                old_counts[line] -= 1
+        if letter in counts:
+            new_counts = counts[letter]
+            for line in SQUARE_LINES[square]:
+                new_counts[line] += 1
+
+    def completes_line(self, square, letter):
+        """True if ``letter`` has a full line through ``square``."""
+        counts = self.counts[letter]
+        for line in SQUARE_LINES[square]:
+            if counts[line] == 3:
+                return True
+        return False
+
+    def has_line(self, letter):
+        return 3 in self.counts[letter]
+
+    def winning_squares(self, letter):
+        """Empty squares that would give ``letter`` a full line, in square order."""
+        counts, other_counts = self.counts[letter], self.counts[OTHER[letter]]
+        squares = set()
+        for line, count in enumerate(counts):
+            if count == 2 and other_counts[line] == 0:
+                for square in LINES[line]:
+                    if self[square] == ' ':
+                        squares.add(square)
+        return sorted(squares)
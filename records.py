@@ -0,0 +1,204 @@
+"""
+Compact binary game records.
+
+A record file starts with an 8-byte magic header followed by games appended
+one after another. Each game is a header byte plus the squares played packed
+two per byte:
+
+    header: bits 0-3 number of moves (0-9)
+            bits 4-5 result (0 unfinished, 1 X won, 2 O won, 3 tie)
+            bit  6   O moved first
+    moves:  ceil(moves / 2) bytes, low nibble first
+
+so a finished game takes at most 6 bytes instead of a JSON file. Players are
+assumed to alternate, which is how play() produces every game.
+
+Usage:
+    python records.py convert tictactoe_save.json games.ttr
+    python records.py dump games.ttr
+"""
+
+# Developed by phoenix marie.
+import json
+import sys
+from collections import namedtuple
+
+MAGIC = b'TTTREC1\n'
+RESULT_CODES = {None: 0, 'X': 1, 'O': 2, 'tie': 3}
+RESULTS = {code: result for result, code in RESULT_CODES.items()}
+FIRST_O = 0x40
+
+GameRecord = namedtuple('GameRecord', ['moves', 'result', 'first_letter'])
+GameRecord.__doc__ = """A recorded game: squares in play order, 'X'/'O'/'tie' (None if unfinished) and who moved first."""
+
+
+def record_from_state(game_state):
+    """Builds a GameRecord from a get_game_state() dictionary."""
+    if (game_state.get('width', 3), game_state.get('height', 3), game_state.get('win_length', 3)) != (3, 3, 3):
+        raise ValueError("Only 3x3 three-in-a-row games can be recorded.")
+    history = [(square, letter) for square, letter in game_state.get('move_history', [])]
+    first_letter = history[0][1] if history else 'X'
+    letter = first_letter
+    for square, move_letter in history:
+        if move_letter != letter:
+            raise ValueError("Recorded games must alternate between X and O.")
+        if not 0 <= square < 9:
+            raise ValueError(f"Square {square} is not on a 3x3 board.")
+        letter = 'O' if letter == 'X' else 'X'
+    board = game_state.get('board', [])
+    result = game_state.get('current_winner')
+    if result is None and board and ' ' not in board:
+        result = 'tie'
+    return GameRecord(tuple(square for square, _ in history), result, first_letter)
+
+
+def state_from_record(record):
+    """Replays a GameRecord into a dictionary load_game_state() accepts."""
+    board = [' '] * 9
+    history = []
+    letter = record.first_letter
+    for square in record.moves:
+        board[square] = letter
+        history.append((square, letter))
+        letter = 'O' if letter == 'X' else 'X'
+    return {
+        'board': board,
+        'current_winner': record.result if record.result in ('X', 'O') else None,
+        'move_history': history,
+    }
+
+
+def encode_record(record):
+    moves = record.moves
+    if len(moves) > 9:
+        raise ValueError("A game has at most 9 moves.")
+    for square in moves:
+        # squares are stored in 4 bits, so bigger boards would decode as other 3x3 games
+        if not 0 <= square < 9:
+            raise ValueError(f"Square {square} is not on a 3x3 board.")
+    header = len(moves) | RESULT_CODES[record.result] << 4
+    if record.first_letter == 'O':
+        header |= FIRST_O
+    data = bytearray([header])
+    for i in range(0, len(moves), 2):
+        data.append(moves[i] | (moves[i + 1] << 4 if i + 1 < len(moves) else 0))
+    return bytes(data)
+
+
+def record_size(header):
+    return 1 + ((header & 0x0F) + 1) // 2
+
+
+def decode_record(data, offset=0):
+    """Decodes the record starting at ``offset``; returns (record, offset of the next record)."""
+    header = data[offset]
+    num_moves = header & 0x0F
+    moves = []
+    for i in range(num_moves):
+        byte = data[offset + 1 + i // 2]
+        moves.append(byte >> 4 if i % 2 else byte & 0x0F)
+    record = GameRecord(tuple(moves), RESULTS[(header >> 4) & 0x03], 'O' if header & FIRST_O else 'X')
+    return record, offset + record_size(header)
+
+
+class RecordWriter():
+    """Appends game records to a file, buffering writes."""
+    def __init__(self, path, buffer_size=1 << 16):
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+        self.buffer = bytearray()
+        self.buffer_size = buffer_size
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, record):
+        self.buffer += encode_record(record)
+        self.count += 1
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_encoded(self, data, count):
+        """Appends ``count`` records that were already encoded (e.g. by a worker process)."""
+        self.buffer += data
+        self.count += count
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_state(self, game_state):
+        self.write(record_from_state(game_state))
+
+    def write_game(self, game):
+        self.write(record_from_state(game.get_game_state()))
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def iter_records(path, chunk_size=1 << 16, with_offsets=False, start=None):
+    """
+    Streams the records of a file without loading it all.
+
+    Args:
+        start (int, optional): Byte offset of the first record to read (an
+            offset previously yielded with ``with_offsets``).
+
+    Yields:
+        GameRecord, or (byte offset, GameRecord) when ``with_offsets`` is set.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a game record file.")
+        base = len(MAGIC)  # file offset of data[0]
+        if start is not None and start > base:
+            f.seek(start)
+            base = start
+        data = b''
+        while True:
+            chunk = f.read(chunk_size)
+            if chunk:
+                data += chunk
+            offset = 0
+            while offset < len(data) and offset + record_size(data[offset]) <= len(data):
+                record, next_offset = decode_record(data, offset)
+                yield (base + offset, record) if with_offsets else record
+                offset = next_offset
+            data = data[offset:]
+            base += offset
+            if not chunk:
+                break
+        if data:
+            raise ValueError(f"{path} ends with a truncated record.")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 3 and argv[0] == 'convert':
+        with open(argv[1]) as f:
+            game_state = json.load(f)
+        with RecordWriter(argv[2]) as writer:
+            writer.write_state(game_state)
+        print(f"Appended {argv[1]} to {argv[2]}")
+    elif len(argv) == 2 and argv[0] == 'dump':
+        for record in iter_records(argv[1]):
+            print(json.dumps(state_from_record(record)))
+    else:
+        print("Usage: records.py convert <save.json> <records file> | dump <records file>")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+Retrograde (backward-induction) solver for generalized Tic Tac Toe.
+
+Positions are grouped into levels by the number of pieces on the board. A
+level only depends on the next one, so the solver starts from the full board
+(every position terminal) and works back to the empty board one level at a
+time, holding just two levels in memory. Every position gets the same
+depth-weighted score SmartComputerPlayer.minimax uses (a win is worth the
+empty squares left plus one), seen from the side to move, so the distance
+to the end of the game is part of the value.
+
+Within a level, a position (X moving first) is addressed by a dense index:
+
+    colex rank of the occupied squares * C(pieces, O pieces) + colex rank of
+    which of the occupied squares (in square order) hold an O
+
+and stored as one signed byte, so a level is a flat byte array. Every
+finished level is written to its own checkpoint file in the output
+directory; an interrupted solve picks up from the last finished level.
+RetrogradeTable memory-maps the files and answers score and best-move
+queries, and can be passed to SmartComputerPlayer as its ``oracle``.
+
+Usage:
+    python retrograde.py 4 4 3 --dir solved_4x4x3
+"""
+
+# Developed by phoenix marie.
+import argparse
+import mmap
+import os
+import struct
+import time
+from itertools import combinations
+from math import comb
+
+from generalized import GeneralizedTicTacToe
+
+MAGIC = b'TTTRETR1'
+HEADER = struct.Struct('<8sBBBB')  # magic, width, height, win_length, level
+CODES = {' ': 0, 'X': 1, 'O': 2}
+# stored byte -> score (scores are kept as two's complement bytes)
+SCORES = tuple(byte - 256 if byte > 127 else byte for byte in range(256))
+
+
+def level_path(directory, level):
+    return os.path.join(directory, f'level_{level:02d}.bin')
+
+
+def level_size(size, level):
+    """Number of positions with ``level`` pieces (X moving first) on a board of ``size`` squares."""
+    return comb(size, level) * comb(level, level // 2)
+
+
+def build_ranks(size):
+    """Colex rank of every bitmask among the masks with the same number of bits."""
+    ranks = [0] * (1 << size)
+    bits = [0] * (1 << size)
+    for mask in range(1, 1 << size):
+        bits[mask] = bits[mask >> 1] + (mask & 1)
+        # rank of {c_0 < ... < c_k-1} is the sum of C(c_i, i + 1); peel off the highest square
+        high = mask.bit_length() - 1
+        ranks[mask] = ranks[mask ^ (1 << high)] + comb(high, bits[mask])
+    return ranks
+
+
+def line_masks(width, height, win_length):
+    game = GeneralizedTicTacToe(width, height, win_length)
+    return [sum(1 << square for square in line) for line in game.winning_lines()]
+
+
+class RetrogradeSolver():
+    """Solves one board configuration level by level, with checkpoints."""
+    def __init__(self, width, height, win_length, directory, progress=None):
+        """
+        Initializes the solver.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            win_length (int): Pieces in a row needed to win.
+            directory (str): Where the level files (checkpoints and result) go.
+            progress (callable, optional): Called as ``progress(level, positions,
+                seconds)`` after every finished level.
+        """
+        self.width = width
+        self.height = height
+        self.win_length = win_length
+        self.size = width * height
+        if self.size > 16:
+            raise ValueError("Retrograde solving is limited to boards of at most 16 squares.")
+        self.directory = directory
+        self.progress = progress
+        self.ranks = build_ranks(self.size)
+        # has_line[mask]: the pieces in ``mask`` contain a full line
+        masks = line_masks(width, height, win_length)
+        self.has_line = bytearray(1 << self.size)
+        for pieces in range(1 << self.size):
+            for line in masks:
+                if pieces & line == line:
+                    self.has_line[pieces] = 1
+                    break
+
+    def finished_levels(self):
+        """Levels already on disk, as long as every level above them is too."""
+        level = self.size
+        while level >= 0 and self.valid_level_file(level):
+            level -= 1
+        return level + 1
+
+    def valid_level_file(self, level):
+        try:
+            with open(level_path(self.directory, level), 'rb') as f:
+                header = f.read(HEADER.size)
+                f.seek(0, os.SEEK_END)
+                length = f.tell()
+        except OSError:
+            return False
+        return (header == HEADER.pack(MAGIC, self.width, self.height, self.win_length, level)
+                and length == HEADER.size + level_size(self.size, level))
+
+    def solve(self):
+        """
+        Solves every level not already on disk.
+
+        Returns:
+            RetrogradeTable: The finished table.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        first_done = self.finished_levels()
+        next_values = None
+        if first_done <= self.size:
+            with open(level_path(self.directory, first_done), 'rb') as f:
+                next_values = f.read()[HEADER.size:]
+        for level in range(first_done - 1, -1, -1):
+            start = time.perf_counter()
+            values = self.solve_level(level, next_values)
+            self.write_level(level, values)
+            next_values = values
+            if self.progress is not None:
+                self.progress(level, len(values), time.perf_counter() - start)
+        return RetrogradeTable(self.directory)
+
+    def solve_level(self, level, next_values):
+        """Scores every position with ``level`` pieces from the scores of the next level."""
+        size, ranks, has_line = self.size, self.ranks, self.has_line
+        o_count = level // 2
+        x_to_move = level % 2 == 0
+        empty = size - level
+        win, loss = (empty + 1) & 0xFF, -(empty + 1) & 0xFF
+        # which of the occupied squares hold an O, with the bits in square order
+        subsets = []
+        for indices in combinations(range(level), o_count):
+            sub = sum(1 << i for i in indices)
+            subsets.append((ranks[sub], sub, indices))
+        child_subsets = comb(level + 1, o_count + (0 if x_to_move else 1))
+        stride = comb(level, o_count)
+        values = bytearray(level_size(size, level))
+        full = (1 << size) - 1
+
+        for occupied in combinations(range(size), level):
+            occupied_mask = sum(1 << square for square in occupied)
+            base = ranks[occupied_mask] * stride
+            children = []
+            if empty:
+                for square in range(size):
+                    bit = 1 << square
+                    if not occupied_mask & bit:
+                        below = (occupied_mask & (bit - 1)).bit_count()
+                        children.append(((1 << below) - 1, below, ranks[occupied_mask | bit] * child_subsets))
+            for sub_rank, sub, indices in subsets:
+                o_mask = 0
+                for i in indices:
+                    o_mask |= 1 << occupied[i]
+                x_mask = occupied_mask ^ o_mask
+                mover, last = (x_mask, o_mask) if x_to_move else (o_mask, x_mask)
+                if has_line[last]:
+                    values[base + sub_rank] = loss
+                    continue
+                if has_line[mover]:  # not reachable in a real game
+                    values[base + sub_rank] = win
+                    continue
+                if occupied_mask == full:
+                    continue  # draw, already 0
+                best = -128
+                for low, below, child_base in children:
+                    # insert the new piece into the O subset at its place among the occupied squares
+                    child_sub = (sub & low) | ((sub >> below) << (below + 1))
+                    if not x_to_move:
+                        child_sub |= 1 << below
+                    score = -SCORES[next_values[child_base + ranks[child_sub]]]
+                    if score > best:
+                        best = score
+                values[base + sub_rank] = best & 0xFF
+        return values
+
+    def write_level(self, level, values):
+        path = level_path(self.directory, level)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.width, self.height, self.win_length, level))
+            f.write(values)
+        os.replace(tmp_path, path)
+
+
+class RetrogradeTable():
+    """Read-only view over a solved directory, usable as a SmartComputerPlayer oracle."""
+    def __init__(self, directory):
+        self.directory = directory
+        with open(level_path(directory, 0), 'rb') as f:
+            magic, self.width, self.height, self.win_length, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{directory} does not hold a retrograde table.")
+        self.size = self.width * self.height
+        self.ranks = build_ranks(self.size)
+        self._lines = line_masks(self.width, self.height, self.win_length)
+        self.levels = {}
+
+    def level_data(self, level):
+        if level not in self.levels:
+            with open(level_path(self.directory, level), 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if data[:HEADER.size] != HEADER.pack(MAGIC, self.width, self.height, self.win_length, level):
+                data.close()
+                raise ValueError(f"Level {level} of {self.directory} does not match level 0.")
+            self.levels[level] = data
+        return self.levels[level]
+
+    def close(self):
+        for data in self.levels.values():
+            data.close()
+        self.levels.clear()
+
+    def matches(self, game):
+        """True if the table was solved for the game's board dimensions and win length."""
+        return (getattr(game, 'width', 3), getattr(game, 'height', 3), getattr(game, 'win_length', 3)) == \
+            (self.width, self.height, self.win_length)
+
+    def index(self, board):
+        """Returns (level, index) of a board, or None if it is not an X-first position."""
+        if len(board) != self.size:
+            return None
+        occupied_mask = sub = 0
+        level = o_count = 0
+        for square, letter in enumerate(board):
+            code = CODES[letter]
+            if code:
+                occupied_mask |= 1 << square
+                if code == 2:
+                    sub |= 1 << level
+                    o_count += 1
+                level += 1
+        if level - o_count not in (o_count, o_count + 1):
+            return None
+        return level, self.ranks[occupied_mask] * comb(level, o_count) + self.ranks[sub]
+
+    def score(self, board):
+        """Minimax score of a position for the side to move, or None if it cannot be looked up."""
+        position = self.index(board)
+        if position is None:
+            return None
+        level, index = position
+        return SCORES[self.level_data(level)[HEADER.size + index]]
+
+    def best_move(self, board):
+        """Best move for the side to move (lowest square among equals), or None if the game is over."""
+        if self.score(board) is None:
+            return None
+        board = list(board)
+        letter = 'X' if board.count('X') == board.count('O') else 'O'
+        other = 'O' if letter == 'X' else 'X'
+        empty = board.count(' ')
+        if self._has_line(board, letter) or self._has_line(board, other):
+            return None  # the game is already over
+        best_move, best_score = None, None
+        for square in range(self.size):
+            if board[square] != ' ':
+                continue
+            board[square] = letter
+            if self._has_line(board, letter):
+                score = empty  # winning now leaves empty - 1 squares
+            else:
+                score = -self.score(board)
+            board[square] = ' '
+            if best_score is None or score > best_score:
+                best_move, best_score = square, score
+        return best_move
+
+    def _has_line(self, board, letter):
+        pieces = sum(1 << square for square, spot in enumerate(board) if spot == letter)
+        return any(pieces & line == line for line in self._lines)
+
+
+def solve(width, height, win_length, directory, progress=None):
+    """Solves (or finishes solving) a board configuration; returns its RetrogradeTable."""
+    return RetrogradeSolver(width, height, win_length, directory, progress).solve()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Retrograde solver for generalized Tic Tac Toe.")
+    parser.add_argument('width', type=int)
+    parser.add_argument('height', type=int)
+    parser.add_argument('win_length', type=int)
+    parser.add_argument('--dir', help="output directory (default solved_<w>x<h>x<k>)")
+    args = parser.parse_args(argv)
+    directory = args.dir or f'solved_{args.width}x{args.height}x{args.win_length}'
+
+    def report(level, positions, seconds):
+        print(f"level {level:2d}: {positions} positions in {seconds:.1f}s", flush=True)
+
+    table = solve(args.width, args.height, args.win_length, directory, report)
+    print(f"Empty board scores {table.score([' '] * table.size)} for X; table in {directory}")
+    return table
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""
+Alpha-beta search for the smart players.
+
+Scores are the same depth-weighted values SmartComputerPlayer.minimax uses
+(a win is worth the number of empty squares left plus one), seen from the side
+to move. Moves are ordered immediate wins first, then forced blocks, then by
+square preference (centre, corners, edges), and the root move is resolved in
+square order among equally scored moves, so a full-depth search picks exactly
+the move minimax would.
+
+The search works on any board exposing ``push_move``/``pop_move`` and
+``available_moves()``, and never touches the recorded move history.
+"""
+
+# Developed by phoenix marie.
+import math
+import time
+
+# centre, corners, then edges
+PREFERRED_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+_square_ranks = {}
+
+
+class BudgetExceeded(Exception):
+    """Raised inside the search when the node or time budget runs out."""
+
+
+def square_ranks(state):
+    """Returns the static preference rank of every square (lower is tried first)."""
+    size = len(state.board)
+    width = getattr(state, 'width', 3)
+    key = (size, width)
+    if key not in _square_ranks:
+        if size == 9:
+            order = PREFERRED_ORDER
+        else:
+            # closest to the centre first, ties broken in square order
+            height = size // width
+            centre_row, centre_col = (height - 1) / 2, (width - 1) / 2
+            order = sorted(range(size), key=lambda square: (
+                max(abs(square // width - centre_row), abs(square % width - centre_col)),
+                abs(square // width - centre_row) + abs(square % width - centre_col),
+                square))
+        ranks = [0] * size
+        for rank, square in enumerate(order):
+            ranks[square] = rank
+        _square_ranks[key] = ranks
+    return _square_ranks[key]
+
+
+def order_moves(state, moves, letter, other):
+    """Orders moves: immediate wins, then blocks of the opponent's wins, then by square rank."""
+    ranks = square_ranks(state)
+    wins = []
+    blocks = []
+    rest = []
+    for move in moves:
+        won = state.push_move(move, letter)
+        state.pop_move()
+        if won:
+            wins.append(move)
+            continue
+        blocked = state.push_move(move, other)
+        state.pop_move()
+        if blocked:
+            blocks.append(move)
+        else:
+            rest.append(move)
+    rest.sort(key=ranks.__getitem__)
+    return wins + blocks + rest
+
+
+class AlphaBetaSearch():
+    """Alpha-beta search with move ordering and optional iterative deepening."""
+    def __init__(self, max_nodes=None, max_time=None, iterative=False, stats=None):
+        """
+        Initializes the search.
+
+        Args:
+            max_nodes (int, optional): Node budget for an iterative search.
+            max_time (float, optional): Time budget in seconds for an iterative search.
+            iterative (bool): Deepen one ply at a time and keep the last completed
+                iteration when a budget runs out. Implied by either budget.
+            stats (SearchStats, optional): Receives node counts and per-depth
+                branching when the calling player is instrumented.
+        """
+        self.max_nodes = max_nodes
+        self.max_time = max_time
+        self.iterative = iterative or max_nodes is not None or max_time is not None
+        self.nodes = 0
+        self.deadline = None
+        self.cutoff = False
+        self.stats = stats
+        self.root_depth = 0
+
+    def search(self, state, letter):
+        """
+        Searches the position for ``letter``, who is to move.
+
+        Returns:
+            dict: 'position' (best move), 'score' (for ``letter``), 'depth' (plies
+            searched), 'nodes' (nodes visited) and 'proven' (True when the search
+            reached the end of every line, so the score is exact).
+        """
+        start = time.perf_counter()
+        self.nodes = 0
+        self.deadline = start + self.max_time if self.max_time is not None else None
+        max_depth = len(state.available_moves())
+
+        if not self.iterative:
+            best = self.search_root(state, letter, max_depth)
+            best['depth'] = max_depth
+            best['nodes'] = self.nodes
+            if self.stats is not None:
+                self.stats.nodes += self.nodes
+            return best
+
+        moves = state.available_moves()
+        other = 'O' if letter == 'X' else 'X'
+        best = {'position': order_moves(state, moves, letter, other)[0] if moves else None,
+                'score': 0, 'depth': 0, 'proven': not moves}
+        if self.deadline is not None:
+            # nothing interrupts a move ordering once it has started, so keep the
+            # time of a root ordering (times two, for the slack) in reserve to
+            # finish on time on big boards
+            self.deadline -= 2 * (time.perf_counter() - start)
+        for depth in range(1, max_depth + 1):
+            try:
+                result = self.search_root(state, letter, depth)
+            except BudgetExceeded:
+                break
+            result['depth'] = depth
+            best = result
+            if result['proven']:
+                break
+        best['nodes'] = self.nodes
+        if self.stats is not None:
+            self.stats.nodes += self.nodes
+        return best
+
+    def search_root(self, state, letter, depth):
+        other = 'O' if letter == 'X' else 'X'
+        moves = state.available_moves()
+        self.cutoff = False
+        self.root_depth = depth
+        if not moves:
+            return {'position': None, 'score': 0, 'proven': True}
+        if self.stats is not None:
+            self.stats.expand(0, len(moves))
+
+        scores = {}
+        best_move, alpha = None, -math.inf
+        for move in order_moves(state, moves, letter, other):
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise BudgetExceeded()
+            score = self.child_score(state, move, letter, other, len(moves), depth, alpha, math.inf)
+            scores[move] = score
+            if score > alpha:
+                best_move, alpha = move, score
+
+        if self.cutoff:
+            # depth-limited scores are mostly 0, so a square-order tie-break would
+            # just pick the lowest square; keep the best move by ordering instead
+            return {'position': best_move, 'score': alpha, 'proven': False}
+
+        # minimax keeps the first move in square order among equal scores; any
+        # earlier move that failed low may still tie, so re-test those with a
+        # null window around the best score
+        for move in sorted(moves):
+            if move >= best_move:
+                break
+            if scores[move] < alpha:  # fail-soft bound already below the best score
+                continue
+            score = self.child_score(state, move, letter, other, len(moves), depth, alpha - 1, alpha)
+            if score >= alpha:
+                best_move = move
+                break
+        return {'position': best_move, 'score': alpha, 'proven': True}
+
+    def child_score(self, state, move, letter, other, num_moves, depth, alpha, beta):
+        # plays ``move`` for ``letter`` and scores the result for ``letter``
+        if state.push_move(move, letter):
+            state.pop_move()
+            return num_moves
+        try:
+            return -self.negamax(state, other, letter, depth - 1, -beta, -alpha)
+        finally:
+            state.pop_move()
+
+    def negamax(self, state, letter, other, depth, alpha, beta):
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise BudgetExceeded()
+        if self.deadline is not None and not self.nodes & 15 and time.perf_counter() > self.deadline:
+            raise BudgetExceeded()
+
+        moves = state.available_moves()
+        if not moves:
+            return 0
+        if depth <= 0:
+            self.cutoff = True
+            return 0
+        # ordering the moves of an inner node costs as much as many leaves, so
+        # check the clock before every one rather than every 16th node
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise BudgetExceeded()
+        if self.stats is not None:
+            self.stats.expand(self.root_depth - depth, len(moves))
+
+        best = -math.inf
+        for move in order_moves(state, moves, letter, other):
+            score = self.child_score(state, move, letter, other, len(moves), depth, alpha, beta)
+            if score > best:
+                best = score
+                if best > alpha:
+                    alpha = best
+                    if alpha >= beta:
+                        break
+        return best
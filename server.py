@@ -0,0 +1,381 @@
+"""
+Asyncio game server hosting many concurrent Tic Tac Toe sessions.
+
+Every connection is a session that plays one game at a time against a
+computer player. AI moves run in a worker pool, so a slow search never
+blocks the event loop. The protocol is one line per request and one line
+per reply:
+
+    NEW <X|O> <random|smart|mcts>   start a game, playing the given letter
+    MOVE <square>                   play a square (0-8)
+    BOARD                           show the current game
+    STATS                           server statistics as JSON, with the
+                                    latency of every live session
+    QUIT                            close the session
+
+Game replies have the form ``STATE <board> <status> <ai move>``. The board
+is 9 characters with '.' for empty squares. The status is TURN (your move),
+X or O (that letter won) or TIE. The AI move is '-' when the AI has not
+moved. Errors are answered with ``ERR <reason>``.
+
+Usage:
+    python server.py serve --port 8765 --workers 4
+    python server.py bench --clients 1000 --games 5
+"""
+
+# Developed by phoenix marie.
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from compact import CompactTicTacToe
+from engine import MCTSComputerPlayer, RandomComputerPlayer, SmartComputerPlayer, TicTacToe
+from transposition import TranspositionTable
+
+OPPONENTS = {
+    'random': RandomComputerPlayer,
+    'smart': SmartComputerPlayer,
+    'mcts': MCTSComputerPlayer,
+}
+
+# completed sessions whose latency STATS still reports individually
+RECENT_SESSIONS = 100
+
+# players keep state between moves (MCTS trees, transposition tables), so every
+# worker thread (and every worker process) gets its own
+_worker_state = threading.local()
+
+
+class AIMoveError(Exception):
+    """The computer player could not produce a legal move."""
+
+
+def compute_move(board, letter, opponent, deadline_ms=None):
+    """Picks the AI move for a board; runs inside the worker pool."""
+    players = getattr(_worker_state, 'players', None)
+    if players is None:
+        players = _worker_state.players = {}
+    key = (opponent, letter, deadline_ms)
+    if key not in players:
+        if opponent == 'smart':
+            # a private table: the class-wide one is not safe to share between threads
+            players[key] = SmartComputerPlayer(letter, table=TranspositionTable(), deadline_ms=deadline_ms)
+        else:
+            players[key] = OPPONENTS[opponent](letter)
+    game = TicTacToe()
+    game.board = list(board)
+    return players[key].get_move(game)
+
+
+class Session():
+    """One client connection and the game it is currently playing."""
+    # a busy server holds one of these per connection, so keep them small
+    __slots__ = ('session_id', 'game', 'letter', 'ai_letter', 'opponent', 'started', 'requests',
+                 'total_latency', 'max_latency', 'games')
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.game = None
+        self.letter = None
+        self.ai_letter = None
+        self.opponent = None
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.games = 0
+
+    def record_latency(self, latency):
+        self.requests += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    def latency_stats(self):
+        return {
+            'session': self.session_id,
+            'games': self.games,
+            'requests': self.requests,
+            'mean_latency': self.total_latency / self.requests if self.requests else 0.0,
+            'max_latency': self.max_latency,
+        }
+
+    def status(self):
+        if self.game.current_winner:
+            return self.game.current_winner
+        if not self.game.empty_squares():
+            return 'TIE'
+        return 'TURN'
+
+    def state_line(self, ai_move=None):
+        board = ''.join(spot if spot != ' ' else '.' for spot in self.game.board)
+        return f"STATE {board} {self.status()} {'-' if ai_move is None else ai_move}"
+
+
+class GameServer():
+    """Hosts game sessions over TCP or a Unix socket."""
+    def __init__(self, workers=None, use_threads=False, deadline_ms=None):
+        """
+        Initializes the server.
+
+        Args:
+            workers (int, optional): Size of the AI worker pool.
+            use_threads (bool): Use a thread pool instead of processes (cheaper
+                to start, but searches then share the interpreter lock).
+            deadline_ms (float, optional): Answer every smart move within this
+                many milliseconds (SmartComputerPlayer's anytime mode).
+        """
+        self.deadline_ms = deadline_ms
+        pool_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        self.executor = pool_class(max_workers=workers)
+        self.server = None
+        self.next_session_id = 0
+        self.sessions = {}  # live sessions by id
+        self.recent_sessions = deque(maxlen=RECENT_SESSIONS)  # latency of the last completed ones
+        self.completed_sessions = 0
+        self.completed_games = 0
+        self.requests = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.started = time.perf_counter()
+
+    async def start(self, host='127.0.0.1', port=8765, path=None):
+        """Starts listening on ``host:port``, or on the Unix socket ``path`` when given."""
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_client, path=path, backlog=4096)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+        self.started = time.perf_counter()
+        return self.server
+
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown()
+
+    @property
+    def active_sessions(self):
+        return len(self.sessions)
+
+    def stats(self):
+        """Server totals (live sessions included) plus the latency of every live and recently completed session."""
+        uptime = time.perf_counter() - self.started
+        live = list(self.sessions.values())
+        requests = self.requests + sum(session.requests for session in live)
+        total_latency = self.total_latency + sum(session.total_latency for session in live)
+        return {
+            'uptime': uptime,
+            'active_sessions': len(live),
+            'completed_sessions': self.completed_sessions,
+            'completed_games': self.completed_games,
+            'sessions_per_second': self.completed_sessions / uptime if uptime else 0.0,
+            'games_per_second': self.completed_games / uptime if uptime else 0.0,
+            'requests': requests,
+            'mean_latency': total_latency / requests if requests else 0.0,
+            'max_latency': max([self.max_latency] + [session.max_latency for session in live]),
+            'sessions': [session.latency_stats() for session in live],
+            'recent_sessions': list(self.recent_sessions),
+        }
+
+    async def handle_client(self, reader, writer):
+        session = Session(self.next_session_id)
+        self.next_session_id += 1
+        self.sessions[session.session_id] = session
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                start = time.perf_counter()
+                reply = await self.handle_line(session, line.decode().split())
+                writer.write(reply.encode() + b'\n')
+                await writer.drain()
+                session.record_latency(time.perf_counter() - start)
+                if reply == 'BYE':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self.sessions[session.session_id]
+            self.recent_sessions.append(session.latency_stats())
+            self.completed_sessions += 1
+            self.requests += session.requests
+            self.total_latency += session.total_latency
+            self.max_latency = max(self.max_latency, session.max_latency)
+            writer.close()
+
+    async def handle_line(self, session, words):
+        if not words:
+            return "ERR empty request"
+        command = words[0].upper()
+        try:
+            if command == 'NEW':
+                return await self.new_game(session, words[1:])
+            if command == 'MOVE':
+                return await self.move(session, words[1:])
+        except AIMoveError as e:
+            # the AI never moved, so the game cannot go on
+            session.game = None
+            return f"ERR {e}; game abandoned"
+        if command == 'BOARD':
+            return session.state_line() if session.game else "ERR no game in progress"
+        if command == 'STATS':
+            return "STATS " + json.dumps(self.stats())
+        if command == 'QUIT':
+            return "BYE"
+        return f"ERR unknown command {words[0]}"
+
+    async def new_game(self, session, args):
+        if len(args) != 2 or args[0].upper() not in ('X', 'O') or args[1].lower() not in OPPONENTS:
+            return f"ERR usage: NEW <X|O> <{'|'.join(OPPONENTS)}>"
+        session.game = CompactTicTacToe()
+        session.letter = args[0].upper()
+        session.ai_letter = 'O' if session.letter == 'X' else 'X'
+        session.opponent = args[1].lower()
+        ai_move = None
+        if session.ai_letter == 'X':
+            ai_move = await self.ai_move(session)
+        return session.state_line(ai_move)
+
+    async def move(self, session, args):
+        game = session.game
+        if game is None or session.status() != 'TURN':
+            return "ERR no game in progress"
+        try:
+            square = int(args[0])
+        except (IndexError, ValueError):
+            return "ERR usage: MOVE <square>"
+        if square not in game.available_moves():
+            return f"ERR square {square} is not available"
+        game.make_move(square, session.letter)
+        ai_move = None
+        if session.status() == 'TURN':
+            ai_move = await self.ai_move(session)
+        if session.status() != 'TURN':
+            self.completed_games += 1
+            session.games += 1
+        return session.state_line(ai_move)
+
+    async def ai_move(self, session):
+        loop = asyncio.get_running_loop()
+        try:
+            square = await loop.run_in_executor(self.executor, compute_move, list(session.game.board),
+                                                session.ai_letter, session.opponent, self.deadline_ms)
+        except Exception as e:
+            raise AIMoveError(f"AI move failed: {e!r}") from e
+        if square not in session.game.available_moves() or not session.game.make_move(square, session.ai_letter):
+            raise AIMoveError(f"AI chose unavailable square {square}")
+        return square
+
+
+async def play_client(host, port, games, opponent, latencies, results, path=None):
+    """Plays ``games`` games with random moves over one connection."""
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    async def request(line):
+        start = time.perf_counter()
+        writer.write(line.encode() + b'\n')
+        await writer.drain()
+        reply = (await reader.readline()).decode().split()
+        latencies.append(time.perf_counter() - start)
+        return reply
+
+    for _ in range(games):
+        reply = await request(f"NEW {random.choice('XO')} {opponent}")
+        while reply[0] == 'STATE' and reply[2] == 'TURN':
+            empty = [i for i, spot in enumerate(reply[1]) if spot == '.']
+            reply = await request(f"MOVE {random.choice(empty)}")
+        if reply[0] != 'STATE':
+            raise RuntimeError(' '.join(reply))
+        results[reply[2]] = results.get(reply[2], 0) + 1
+    await request("QUIT")
+    writer.close()
+
+
+async def run_clients(host='127.0.0.1', port=8765, clients=100, games=1, opponent='random', path=None):
+    """
+    Local client harness: runs many concurrent clients against a server.
+
+    Returns:
+        dict: games played, results by status, elapsed time, games per second
+        and mean/max request latency seen by the clients.
+    """
+    latencies = []
+    results = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(play_client(host, port, games, opponent, latencies, results, path)
+                           for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    played = sum(results.values())
+    return {
+        'clients': clients,
+        'games': played,
+        'results': results,
+        'elapsed': elapsed,
+        'games_per_second': played / elapsed if elapsed else 0.0,
+        'mean_latency': sum(latencies) / len(latencies) if latencies else 0.0,
+        'max_latency': max(latencies, default=0.0),
+    }
+
+
+async def benchmark(clients, games, opponent, workers=None, use_threads=False):
+    """Starts a server on a free local port, runs the client harness against it and returns both sides' stats."""
+    server = GameServer(workers, use_threads)
+    await server.start(port=0)
+    try:
+        client_stats = await run_clients(port=server.port(), clients=clients, games=games, opponent=opponent)
+    finally:
+        await server.close()
+    return {'client': client_stats, 'server': server.stats()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Asyncio Tic Tac Toe server.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve = subparsers.add_parser('serve', help="run the server")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--unix', help="listen on this Unix socket path instead of TCP")
+    serve.add_argument('--workers', type=int, default=None)
+    serve.add_argument('--threads', action='store_true', help="use a thread pool for AI moves")
+    serve.add_argument('--deadline-ms', type=float, default=None,
+                       help="answer every smart move within this many milliseconds")
+    bench = subparsers.add_parser('bench', help="run a local server and hammer it with clients")
+    bench.add_argument('--clients', type=int, default=100)
+    bench.add_argument('--games', type=int, default=1)
+    bench.add_argument('--opponent', choices=sorted(OPPONENTS), default='random')
+    bench.add_argument('--workers', type=int, default=None)
+    bench.add_argument('--threads', action='store_true')
+    args = parser.parse_args(argv)
+
+    if args.command == 'bench':
+        print(json.dumps(asyncio.run(benchmark(args.clients, args.games, args.opponent,
+                                               args.workers, args.threads)), indent=2))
+        return
+
+    async def serve_forever():
+        server = GameServer(args.workers, args.threads, args.deadline_ms)
+        listener = await server.start(args.host, args.port, args.unix)
+        print(f"Serving on {args.unix or f'{args.host}:{server.port()}'}")
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    asyncio.run(serve_forever())
+
+
+if __name__ == '__main__':
+    main()
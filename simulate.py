@@ -0,0 +1,161 @@
+"""
+Headless self-play simulator.
+
+Plays large numbers of games between computer players without printing or
+sleeping, spread over a process pool. Games are split into fixed-size chunks
+and every chunk seeds its own random generator from (seed, chunk index), so
+the totals for a given seed are the same no matter how many workers run them.
+
+Usage:
+    python simulate.py random smart --games 100000 --workers 4 --seed 1 --record games.ttr
+"""
+
+# Developed by phoenix marie.
+import argparse
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from bitboard import BitboardTicTacToe
+from compact import CompactTicTacToe
+from engine import RandomComputerPlayer, SmartComputerPlayer, TicTacToe, play
+from records import RecordWriter, encode_record, record_from_state
+
+PLAYER_TYPES = {
+    'random': RandomComputerPlayer,
+    'smart': SmartComputerPlayer,
+}
+
+BOARD_TYPES = {
+    'list': TicTacToe,
+    'bitboard': BitboardTicTacToe,
+    'compact': CompactTicTacToe,
+}
+
+
+def chunk_seed(seed, chunk_index):
+    return (seed << 32) + chunk_index
+
+
+def play_chunk(x_type, o_type, num_games, seed, board_type='list', record=False):
+    """
+    Plays one chunk of games in the current process.
+
+    Returns:
+        dict: number of games won by 'X', won by 'O', and tied ('tie'), plus
+        the games encoded as binary records under 'records' when ``record`` is set.
+    """
+    random.seed(seed)
+    x_player = PLAYER_TYPES[x_type]('X')
+    o_player = PLAYER_TYPES[o_type]('O')
+    board_class = BOARD_TYPES[board_type]
+    counts = {'X': 0, 'O': 0, 'tie': 0}
+    encoded = bytearray()
+    for _ in range(num_games):
+        game = board_class()
+        result = play(game, x_player, o_player, print_game=False)
+        counts[result if result else 'tie'] += 1
+        if record:
+            encoded += encode_record(record_from_state(game.get_game_state()))
+    if record:
+        counts['records'] = bytes(encoded)
+    return counts
+
+
+def simulate(x_type, o_type, num_games, workers=None, chunk_size=1000, seed=0, board_type='list',
+             record_path=None):
+    """
+    Plays ``num_games`` games and streams the running totals.
+
+    Args:
+        x_type (str): 'random' or 'smart' for the X player.
+        o_type (str): 'random' or 'smart' for the O player.
+        num_games (int): Total number of games.
+        workers (int, optional): Worker processes; defaults to the CPU count.
+            With one worker the games run in this process.
+        chunk_size (int): Games per chunk (the unit of work and of seeding).
+        seed (int): Base seed for the whole run.
+        board_type (str): 'list', 'bitboard' or 'compact'.
+        record_path (str, optional): Append every game to this binary record file.
+
+    Yields:
+        dict: cumulative 'games', 'X', 'O', 'tie', 'elapsed' (seconds) and
+        'games_per_second' after every finished chunk.
+    """
+    for name in (x_type, o_type):
+        if name not in PLAYER_TYPES:
+            raise ValueError(f"Unknown player type {name!r}, expected one of {sorted(PLAYER_TYPES)}.")
+    if board_type not in BOARD_TYPES:
+        raise ValueError(f"Unknown board type {board_type!r}, expected one of {sorted(BOARD_TYPES)}.")
+    workers = workers or os.cpu_count() or 1
+    chunks = [(index, min(chunk_size, num_games - start))
+              for index, start in enumerate(range(0, num_games, chunk_size))]
+
+    totals = {'games': 0, 'X': 0, 'O': 0, 'tie': 0}
+    start_time = time.perf_counter()
+    record = record_path is not None
+    writer = RecordWriter(record_path) if record else None
+
+    def report(counts):
+        for key in ('X', 'O', 'tie'):
+            totals[key] += counts[key]
+        games = counts['X'] + counts['O'] + counts['tie']
+        totals['games'] += games
+        if writer is not None:
+            writer.write_encoded(counts['records'], games)
+        elapsed = time.perf_counter() - start_time
+        return dict(totals, elapsed=elapsed,
+                    games_per_second=totals['games'] / elapsed if elapsed else 0.0)
+
+    try:
+        if workers == 1:
+            for index, size in chunks:
+                yield report(play_chunk(x_type, o_type, size, chunk_seed(seed, index), board_type, record))
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            remaining = iter(chunks)
+            # keep a bounded number of chunks in flight so huge runs don't queue everything up front
+            for index, size in remaining:
+                pending.add(pool.submit(play_chunk, x_type, o_type, size, chunk_seed(seed, index),
+                                        board_type, record))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield report(future.result())
+                    next_chunk = next(remaining, None)
+                    if next_chunk is not None:
+                        index, size = next_chunk
+                        pending.add(pool.submit(play_chunk, x_type, o_type, size,
+                                                chunk_seed(seed, index), board_type, record))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Tic Tac Toe self-play.")
+    parser.add_argument('x_player', choices=sorted(PLAYER_TYPES))
+    parser.add_argument('o_player', choices=sorted(PLAYER_TYPES))
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--board', choices=sorted(BOARD_TYPES), default='list')
+    parser.add_argument('--record', help="append every game to this binary record file")
+    args = parser.parse_args(argv)
+
+    stats = None
+    for stats in simulate(args.x_player, args.o_player, args.games, args.workers,
+                          args.chunk_size, args.seed, args.board, args.record):
+        print(f"{stats['games']} games: X {stats['X']}, O {stats['O']}, ties {stats['tie']} "
+              f"({stats['games_per_second']:.0f} games/s)")
+    return stats
+
+
+if __name__ == '__main__':
+    main()
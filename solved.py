@@ -0,0 +1,161 @@
+"""
+Solved-game table for 3x3 Tic Tac Toe.
+
+Every legal position reachable from the empty board (5,478 of them) is solved
+once with the same depth-weighted scoring SmartComputerPlayer.minimax uses,
+and the best move for the side to move is stored in a flat binary file:
+
+    magic (8 bytes) | best move per position (3**9 bytes) | score per position (3**9 signed bytes)
+
+A position is addressed by its base-3 code (' ' = 0, 'X' = 1, 'O' = 2, square 0
+is the least significant digit), so a lookup is a single index into a
+memory-mapped file. Run this module to (re)build the table.
+"""
+
+# Developed by phoenix marie.
+import mmap
+import os
+import sys
+
+MAGIC = b'TTTSOLV1'
+NUM_CODES = 3 ** 9
+NO_MOVE = 0xFF
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tictactoe_solved.bin')
+
+DIGITS = {' ': 0, 'X': 1, 'O': 2}
+POWERS = tuple(3 ** i for i in range(9))
+LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+    (0, 4, 8), (2, 4, 6),  # Diagonals
+)
+
+
+def position_code(board):
+    """Returns the base-3 index of a 9-square board."""
+    code = 0
+    for square in range(9):
+        code += DIGITS[board[square]] * POWERS[square]
+    return code
+
+
+def side_to_move(board):
+    """Returns the letter to move in a legal position (X always moves first)."""
+    return 'X' if board.count('X') == board.count('O') else 'O'
+
+
+def _has_line(board, letter):
+    for a, b, c in LINES:
+        if board[a] == letter and board[b] == letter and board[c] == letter:
+            return True
+    return False
+
+
+def solve(on_position=None):
+    """
+    Solves every reachable position.
+
+    Args:
+        on_position (callable, optional): Called as ``on_position(code, move, score)``
+            for every reachable position; ``move`` is None for finished games.
+
+    Returns:
+        dict: position code -> (best move or None, score for the side to move).
+    """
+    solutions = {}
+    board = [' '] * 9
+
+    def search(letter, code):
+        if code in solutions:
+            return solutions[code][1]
+        other = 'O' if letter == 'X' else 'X'
+        empty = board.count(' ')
+        if _has_line(board, other):
+            result = (None, -(empty + 1))
+        elif not empty:
+            result = (None, 0)
+        else:
+            # first strictly better move wins ties, exactly like minimax
+            best_move, best_score = None, None
+            for square in range(9):
+                if board[square] != ' ':
+                    continue
+                board[square] = letter
+                score = -search(other, code + DIGITS[letter] * POWERS[square])
+                board[square] = ' '
+                if best_score is None or score > best_score:
+                    best_move, best_score = square, score
+            result = (best_move, best_score)
+        solutions[code] = result
+        if on_position is not None:
+            on_position(code, *result)
+        return result[1]
+
+    search('X', 0)
+    return solutions
+
+
+def build_table(path=DEFAULT_PATH):
+    """Solves the game and writes the binary best-move table to ``path``."""
+    moves = bytearray([NO_MOVE]) * NUM_CODES
+    scores = bytearray(NUM_CODES)
+    solutions = solve()
+    for code, (move, score) in solutions.items():
+        if move is not None:
+            moves[code] = move
+        scores[code] = score & 0xFF
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(moves)
+        f.write(scores)
+    os.replace(tmp_path, path)
+    _loaded_tables.pop(path, None)
+    return len(solutions)
+
+
+class SolvedTable():
+    """Read-only view over a solved-game table file."""
+    def __init__(self, data):
+        if len(data) != len(MAGIC) + 2 * NUM_CODES or data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a solved Tic Tac Toe table.")
+        self.data = data
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(data)
+        except ValueError:
+            data.close()
+            raise
+
+    def best_move(self, board):
+        """Returns the best move for the side to move, or None if the game is over."""
+        move = self.data[len(MAGIC) + position_code(board)]
+        return None if move == NO_MOVE else move
+
+    def score(self, board):
+        """Returns the minimax score of the position for the side to move."""
+        score = self.data[len(MAGIC) + NUM_CODES + position_code(board)]
+        return score - 256 if score > 127 else score
+
+
+_loaded_tables = {}
+
+
+def load_table(path=DEFAULT_PATH):
+    """Returns the table stored at ``path``, or None if it is missing or invalid."""
+    if path not in _loaded_tables:
+        try:
+            _loaded_tables[path] = SolvedTable.from_file(path)
+        except (OSError, ValueError):
+            _loaded_tables[path] = None
+    return _loaded_tables[path]
+
+
+if __name__ == '__main__':
+    out_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    count = build_table(out_path)
+    print(f"Solved {count} positions, table written to {out_path}")
@@ -0,0 +1,113 @@
+"""
+Board symmetries for 3x3 Tic Tac Toe.
+
+The board has 8 symmetries (4 rotations, each optionally mirrored). Mapping
+every position to one canonical representative lets caches and tables store
+a single entry for all symmetric positions, and moves are translated between
+the original and the canonical frame with the transform that was used.
+"""
+
+# Developed by phoenix marie.
+
+
+def _rotate(perm):
+    # square i of the rotated board shows what was at perm[...] before
+    return tuple(perm[6 - 3 * (i % 3) + i // 3] for i in range(9))
+
+
+def _mirror(perm):
+    return tuple(perm[3 * (i // 3) + 2 - i % 3] for i in range(9))
+
+
+def _build_transforms():
+    transforms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        transforms.append(perm)
+        transforms.append(_mirror(perm))
+        perm = _rotate(perm)
+    return tuple(transforms)
+
+
+# TRANSFORMS[t][i] is the original square shown at square i of transformed board t
+TRANSFORMS = _build_transforms()
+# INVERSE_TRANSFORMS[t][s] is where original square s ends up in transformed board t
+INVERSE_TRANSFORMS = tuple(
+    tuple(perm.index(square) for square in range(9)) for perm in TRANSFORMS
+)
+IDENTITY = 0
+
+# every 9-bit mask pushed through every transform, for bitboard canonicalization;
+# built on first use so importing this module stays cheap
+_mask_transforms = None
+
+
+def _build_mask_transforms():
+    global _mask_transforms
+    _mask_transforms = tuple(
+        tuple(
+            sum(1 << inverse[square] for square in range(9) if mask & (1 << square))
+            for mask in range(512)
+        )
+        for inverse in INVERSE_TRANSFORMS
+    )
+    return _mask_transforms
+
+
+# SQUARE_WEIGHTS[t][s] is the base-3 place value of original square s in transformed board t
+SQUARE_WEIGHTS = tuple(tuple(3 ** inverse[square] for square in range(9)) for inverse in INVERSE_TRANSFORMS)
+DIGITS = {' ': 0, 'X': 1, 'O': 2}
+
+
+def transform_board(board, transform):
+    """Returns the board as seen through the given transform, as a string."""
+    perm = TRANSFORMS[transform]
+    return ''.join([board[perm[i]] for i in range(9)])
+
+
+def canonicalize(board):
+    """
+    Maps a board to its canonical form.
+
+    Args:
+        board: Any 9-square sequence of ' ', 'X' and 'O'.
+
+    Returns:
+        tuple: (canonical board string, transform index used to reach it).
+    """
+    best, best_transform = None, IDENTITY
+    for transform, perm in enumerate(TRANSFORMS):
+        candidate = ''.join([board[perm[i]] for i in range(9)])
+        if best is None or candidate < best:
+            best, best_transform = candidate, transform
+    return best, best_transform
+
+
+def canonicalize_masks(x_bits, o_bits):
+    """Bitboard version of canonicalize: returns ((x_bits, o_bits), transform)."""
+    best, best_transform = None, IDENTITY
+    for transform, table in enumerate(_mask_transforms or _build_mask_transforms()):
+        candidate = (table[x_bits], table[o_bits])
+        if best is None or candidate < best:
+            best, best_transform = candidate, transform
+    return best, best_transform
+
+
+def to_canonical_square(square, transform):
+    """Translates a square of the original board into the canonical frame."""
+    return INVERSE_TRANSFORMS[transform][square]
+
+
+def from_canonical_square(square, transform):
+    """Translates a square of the canonical board back to the original frame."""
+    return TRANSFORMS[transform][square]
+
+
+def canonical_code(board):
+    """
+    Returns the smallest base-3 code (' ' = 0, 'X' = 1, 'O' = 2) over the 8
+    transformed boards, an integer shared by all symmetric versions of a board.
+    """
+    digits = [DIGITS[spot] for spot in board]
+    return min(sum(digit * weights[square] for square, digit in enumerate(digits) if digit)
+               for weights in SQUARE_WEIGHTS)
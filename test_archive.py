@@ -0,0 +1,61 @@
+"""
+Tests for the game archive and its incrementally updated position index.
+"""
+
+# Developed by phoenix marie.
+import random
+
+from archive import GameArchive
+from engine import RandomComputerPlayer, TicTacToe, play
+
+
+def random_games(count, seed):
+    random.seed(seed)
+    games = []
+    for _ in range(count):
+        game = TicTacToe()
+        play(game, RandomComputerPlayer('X'), RandomComputerPlayer('O'), print_game=False)
+        games.append(game)
+    return games
+
+
+def build(path, batches):
+    with GameArchive(str(path)) as archive:
+        for games in batches:
+            for game in games:
+                archive.add_game(game)
+            archive.update_index()
+    with open(str(path) + '.idx', 'rb') as f:
+        return f.read()
+
+
+def test_incremental_updates_match_a_single_update(tmp_path):
+    games = random_games(300, seed=3)
+    batches = [games[:40], games[40:41], [], games[41:250], games[250:]]
+    assert build(tmp_path / 'steps.bin', batches) == build(tmp_path / 'once.bin', [games])
+
+
+def test_queries(tmp_path):
+    games = random_games(100, seed=5)
+    with GameArchive(str(tmp_path / 'games.bin')) as archive:
+        for game in games[:60]:
+            archive.add_game(game)
+        assert archive.update_index() == 60
+        assert archive.update_index() == 0
+        for game in games[60:]:
+            archive.add_game(game)
+        assert archive.update_index() == 40
+
+        empty = [' '] * 9
+        outcomes = archive.outcomes(empty)
+        assert sum(outcomes.values()) == 100
+        assert outcomes['X'] == sum(game.current_winner == 'X' for game in games)
+        offsets = archive.games_through(empty)
+        assert len(offsets) == 100
+        for game, offset in zip(games, offsets):
+            assert archive.load_game(offset).move_history == game.move_history
+
+        # a corner opening and its mirror images share one entry
+        corner = ['X'] + [' '] * 8
+        through = sum(game.move_history[0][0] in (0, 2, 6, 8) for game in games)
+        assert len(archive.games_through(corner)) == through
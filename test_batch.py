@@ -0,0 +1,58 @@
+"""
+Regression tests: the vectorized batch functions agree with the single-board
+TicTacToe methods on every 3x3 board.
+"""
+
+# Developed by phoenix marie.
+import numpy as np
+import pytest
+
+import batch
+from engine import Player, TicTacToe
+
+LETTERS = ' XO'
+
+
+@pytest.fixture(scope='module')
+def boards():
+    codes = np.arange(3 ** 9)
+    return (codes[:, None] // 3 ** np.arange(9) % 3).astype(np.uint8)
+
+
+def games(boards):
+    for row in boards:
+        game = TicTacToe()
+        game.board = [LETTERS[code] for code in row]
+        yield game
+
+
+def test_encode_letters(boards):
+    letters = np.array([[LETTERS[code] for code in row] for row in boards[::97]])
+    assert (batch.encode_boards(letters) == boards[::97]).all()
+
+
+def test_status(boards):
+    status = batch.batch_status(boards)
+    for game, code in zip(games(boards), status):
+        if game.check_win('X'):
+            assert code == batch.X_WINS
+        elif game.check_win('O'):
+            assert code == batch.O_WINS
+        elif game.is_full():
+            assert code == batch.DRAW
+        else:
+            assert code == batch.ONGOING
+
+
+@pytest.mark.parametrize('letter', ['X', 'O'])
+def test_wins_evaluate_and_moves(boards, letter):
+    wins = batch.batch_wins(boards, letter)
+    scores = batch.batch_evaluate(boards, letter)
+    winning = batch.moves_from_mask(batch.batch_winning_moves(boards, letter))
+    blocking = batch.moves_from_mask(batch.batch_blocking_moves(boards, letter))
+    player = Player(letter)
+    for i, game in enumerate(games(boards)):
+        assert wins[i] == game.check_win(letter)
+        assert scores[i] == game.evaluate_board(player)
+        assert winning[i] == game.get_potential_winning_moves(letter)
+        assert blocking[i] == game.get_potential_blocking_moves(letter)
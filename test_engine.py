@@ -0,0 +1,52 @@
+"""
+Regression tests for the game loop.
+"""
+
+# Developed by phoenix marie.
+import pytest
+
+from bitboard import BitboardTicTacToe
+from compact import CompactTicTacToe
+from engine import MCTSComputerPlayer, Player, TicTacToe, play
+
+
+class ScriptedPlayer(Player):
+    """Plays the given squares in order."""
+    def __init__(self, letter, squares):
+        super().__init__(letter)
+        self.squares = list(squares)
+
+    def get_move(self, game):
+        return self.squares.pop(0)
+
+
+@pytest.mark.parametrize('board_class', [TicTacToe, BitboardTicTacToe, CompactTicTacToe])
+def test_loaded_game_continues_with_side_to_move(board_class):
+    game = board_class()
+    game.make_move(0, 'X')
+    play(game, ScriptedPlayer('X', [2, 5, 6]), ScriptedPlayer('O', [8, 4, 7, 1]), print_game=False)
+    letters = [letter for _, letter in game.move_history]
+    assert letters[:3] == ['X', 'O', 'X']
+    assert all(a != b for a, b in zip(letters, letters[1:]))
+
+
+def test_position_without_history_uses_piece_counts():
+    game = TicTacToe()
+    game.board = ['X', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ']
+    o_player = ScriptedPlayer('O', [4, 5, 6, 7])
+    play(game, ScriptedPlayer('X', [1, 2, 3, 8]), o_player, print_game=False)
+    assert game.move_history[0] == (4, 'O')
+
+
+@pytest.mark.parametrize('max_time', [0, 1e-7])
+def test_mcts_moves_even_without_time_for_playouts(max_time):
+    game = TicTacToe()
+    game.make_move(4, 'X')
+    player = MCTSComputerPlayer('O', max_time=max_time)
+    assert player.get_move(game) in game.available_moves()
+    assert player.run(game, 0, max_time).visits >= 1
+
+
+def test_mcts_rejects_zero_iterations():
+    with pytest.raises(ValueError):
+        MCTSComputerPlayer('O', iterations=0)
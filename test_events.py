@@ -0,0 +1,73 @@
+"""
+Tests for the play() observers.
+"""
+
+# Developed by phoenix marie.
+import random
+
+import pytest
+
+from engine import RandomComputerPlayer, TicTacToe, play
+from events import GameObserver, Hooks, QueueRecordWriter
+from generalized import GeneralizedTicTacToe
+from records import iter_records, record_from_state
+
+
+class EventLog(GameObserver):
+    def __init__(self):
+        self.events = []
+
+    def move_made(self, game, letter, square):
+        self.events.append(('move', letter, square))
+
+    def game_over(self, game, winner):
+        self.events.append(('over', winner))
+
+
+def test_hooks_skip_inherited_no_ops():
+    hooks = Hooks([EventLog()])
+    assert len(hooks.move_made) == 1 and len(hooks.game_over) == 1
+    assert hooks.game_started == () and hooks.invalid_move == ()
+
+
+def test_observer_sees_every_move():
+    log = EventLog()
+    game = TicTacToe()
+    winner = play(game, RandomComputerPlayer('X'), RandomComputerPlayer('O'), print_game=False, observers=[log])
+    assert [event[1:] for event in log.events[:-1]] == [(letter, square) for square, letter in game.move_history]
+    assert log.events[-1] == ('over', winner)
+
+
+def test_queue_record_writer(tmp_path):
+    random.seed(5)
+    path = str(tmp_path / 'games.ttr')
+    games = []
+    with QueueRecordWriter(path) as writer:
+        for _ in range(200):
+            game = TicTacToe()
+            play(game, RandomComputerPlayer('X'), RandomComputerPlayer('O'), print_game=False, observers=[writer])
+            games.append(record_from_state(game.get_game_state()))
+    assert writer.count == 200
+    assert list(iter_records(path)) == games
+
+
+def test_queue_record_writer_rejects_other_boards(tmp_path):
+    path = str(tmp_path / 'games.ttr')
+    writer = QueueRecordWriter(path)
+    x_player, o_player = RandomComputerPlayer('X'), RandomComputerPlayer('O')
+    with pytest.raises(ValueError):
+        play(GeneralizedTicTacToe(5, 5, 4), x_player, o_player, print_game=False, observers=[writer])
+    # the writer keeps going for games it can hold
+    play(TicTacToe(), x_player, o_player, print_game=False, observers=[writer])
+    writer.close()
+    assert len(list(iter_records(path))) == 1
+
+
+def test_queue_record_writer_reports_thread_failure(tmp_path):
+    writer = QueueRecordWriter(str(tmp_path / 'games.ttr'))
+    writer.queue.put('not a record')
+    writer.thread.join(timeout=5)
+    with pytest.raises(RuntimeError):
+        play(TicTacToe(), RandomComputerPlayer('X'), RandomComputerPlayer('O'), print_game=False, observers=[writer])
+    with pytest.raises(RuntimeError):
+        writer.close()
@@ -0,0 +1,39 @@
+"""
+Tests for the learned value player: after training from self-play it must
+never lose and never choose a move minimax scores worse than its best one.
+"""
+
+# Developed by phoenix marie.
+import numpy as np
+import pytest
+
+import learned
+import symmetry
+
+
+@pytest.fixture(scope='module')
+def model():
+    return learned.train(games=20000, seed=1)
+
+
+def test_trained_player_matches_minimax(model):
+    report = learned.validate(model)
+    assert report['positions'] > 0
+    assert report['mistakes'] == 0
+    assert report['losses'] == 0
+
+
+def test_save_and_load(model, tmp_path):
+    path = str(tmp_path / 'model')
+    model.save(path)
+    assert (learned.ValueModel.load(path).values == model.values).all()
+
+
+def test_canonical_codes_match_symmetry():
+    boards = learned.all_boards()[::41]
+    letters = [[' XO'[code] for code in row] for row in boards]
+    assert learned.canonical_codes(boards).tolist() == [symmetry.canonical_code(board) for board in letters]
+
+
+def test_terminal_values_stay_fixed(model):
+    assert np.array_equal(model.values[model.terminal], model.outcomes[model.terminal])
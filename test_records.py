@@ -0,0 +1,81 @@
+"""
+Round-trip tests for the binary game record format.
+"""
+
+# Developed by phoenix marie.
+import pytest
+
+import records
+from records import GameRecord, RecordWriter, decode_record, encode_record, iter_records
+
+GAMES = [
+    GameRecord((), None, 'X'),
+    GameRecord((4,), None, 'X'),
+    GameRecord((0, 4, 1, 8, 2), 'X', 'X'),
+    GameRecord((4, 0, 8, 2, 1, 7, 6, 3, 5), 'tie', 'X'),
+    GameRecord((4, 0, 2, 6, 3, 1), 'O', 'X'),
+    GameRecord((4, 0, 8, 2, 1), 'O', 'O'),  # O moved first
+    GameRecord((8, 7, 6, 5), None, 'O'),
+]
+
+
+@pytest.mark.parametrize('record', GAMES)
+def test_encode_decode(record):
+    data = encode_record(record)
+    assert len(data) == records.record_size(data[0])
+    assert decode_record(b'junk' + data, 4) == (record, 4 + len(data))
+
+
+def test_state_round_trip():
+    for record in GAMES:
+        assert records.record_from_state(records.state_from_record(record)) == record
+
+
+@pytest.mark.parametrize('record', [GameRecord((9,), None, 'X'), GameRecord((4, 11), None, 'X'),
+                                    GameRecord(tuple(range(9)) + (0,), None, 'X')])
+def test_encode_rejects_other_boards(record):
+    with pytest.raises(ValueError):
+        encode_record(record)
+
+
+@pytest.fixture
+def record_file(tmp_path):
+    path = str(tmp_path / 'games.ttr')
+    with RecordWriter(path, buffer_size=16) as writer:
+        for _ in range(50):
+            for record in GAMES:
+                writer.write(record)
+    return path
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 1 << 16])
+def test_iter_records_across_chunks(record_file, chunk_size):
+    assert list(iter_records(record_file, chunk_size=chunk_size)) == GAMES * 50
+
+
+def test_iter_records_from_offset(record_file):
+    offsets = list(iter_records(record_file, with_offsets=True))
+    assert [record for _, record in offsets] == GAMES * 50
+    offset, record = offsets[123]
+    assert next(iter_records(record_file, start=offset)) == record
+    assert list(iter_records(record_file, chunk_size=5, start=offset)) == (GAMES * 50)[123:]
+
+
+def test_appending_keeps_one_header(record_file):
+    with RecordWriter(record_file) as writer:
+        writer.write(GAMES[2])
+    assert list(iter_records(record_file))[-1] == GAMES[2]
+
+
+def test_truncated_record(record_file):
+    with open(record_file, 'ab') as f:
+        f.write(encode_record(GAMES[3])[:-1])
+    with pytest.raises(ValueError, match='truncated'):
+        list(iter_records(record_file, chunk_size=4))
+
+
+def test_not_a_record_file(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'something else')
+    with pytest.raises(ValueError):
+        list(iter_records(str(path)))
@@ -0,0 +1,66 @@
+"""
+Regression tests: the retrograde solver reproduces the solved 3x3 game and
+brute-force search on a small generalized board.
+"""
+
+# Developed by phoenix marie.
+from engine import RandomComputerPlayer, SmartComputerPlayer, play
+from generalized import GeneralizedTicTacToe
+import retrograde
+import solved
+from transposition import TranspositionTable
+
+
+def decode(code):
+    return [' XO'[code // power % 3] for power in solved.POWERS]
+
+
+def test_3x3_matches_solved(tmp_path):
+    table = retrograde.solve(3, 3, 3, str(tmp_path))
+    try:
+        for code, (move, score) in solved.solve().items():
+            board = decode(code)
+            assert table.score(board) == score, board
+            assert table.best_move(board) == move, board
+    finally:
+        table.close()
+
+
+def test_resume_after_interruption(tmp_path):
+    retrograde.solve(3, 3, 3, str(tmp_path)).close()
+    (tmp_path / 'level_00.bin').unlink()
+    (tmp_path / 'level_03.bin').write_bytes(b'truncated')
+    solver = retrograde.RetrogradeSolver(3, 3, 3, str(tmp_path))
+    assert solver.finished_levels() == 4
+    table = solver.solve()
+    try:
+        assert table.score([' '] * 9) == 0
+    finally:
+        table.close()
+
+
+def test_4x3_oracle_matches_minimax(tmp_path):
+    table = retrograde.solve(4, 3, 3, str(tmp_path))
+    try:
+        game = GeneralizedTicTacToe(4, 3, 3)
+        letter = 'X'
+        for square in (5, 6, 1):
+            game.make_move(square, letter)
+            letter = 'O' if letter == 'X' else 'X'
+        expected = SmartComputerPlayer(letter, table=TranspositionTable()).minimax(game, letter)
+        assert table.score(game.board) == expected['score']
+        assert SmartComputerPlayer(letter, oracle=table).get_move(game) == expected['position']
+    finally:
+        table.close()
+
+
+def test_4x3_oracle_player_never_loses_as_x(tmp_path):
+    table = retrograde.solve(4, 3, 3, str(tmp_path))
+    try:
+        # X wins 4x3 three in a row, so perfect play as X must win every game
+        x_player = SmartComputerPlayer('X', oracle=table)
+        for o_player in (SmartComputerPlayer('O', oracle=table), RandomComputerPlayer('O')):
+            for _ in range(20):
+                assert play(GeneralizedTicTacToe(4, 3, 3), x_player, o_player, print_game=False) == 'X'
+    finally:
+        table.close()
@@ -0,0 +1,92 @@
+"""
+Regression tests: every search agrees with the solved game.
+
+Run with ``python -m pytest``.
+"""
+
+# Developed by phoenix marie.
+import pytest
+
+from bitboard import BitboardTicTacToe
+from compact import CompactTicTacToe
+from engine import SmartComputerPlayer, TicTacToe
+from generalized import GeneralizedTicTacToe
+from search import AlphaBetaSearch
+import solved
+from transposition import TranspositionTable
+
+
+def decode(code):
+    return [' XO'[code // power % 3] for power in solved.POWERS]
+
+
+@pytest.fixture(scope='module')
+def positions():
+    """(board, side to move, best move, score) of every reachable position that is still being played."""
+    return [(decode(code), solved.side_to_move(decode(code)), move, score)
+            for code, (move, score) in solved.solve().items() if move is not None]
+
+
+def make_game(board_class, board):
+    game = board_class()
+    for square, letter in enumerate(board):
+        if letter != ' ':
+            game.make_move(square, letter, record=False)
+    return game
+
+
+def test_reachable_positions(positions):
+    assert len(positions) == 4520
+
+
+@pytest.mark.parametrize('board_class', [TicTacToe, BitboardTicTacToe, CompactTicTacToe, GeneralizedTicTacToe])
+def test_alphabeta_matches_minimax(positions, board_class):
+    for board, letter, move, score in positions:
+        result = AlphaBetaSearch().search(make_game(board_class, board), letter)
+        assert (result['position'], result['score'], result['proven']) == (move, score, True), board
+
+
+@pytest.mark.parametrize('board_class', [TicTacToe, BitboardTicTacToe, CompactTicTacToe])
+def test_minimax_matches_solved(positions, board_class):
+    table = TranspositionTable()
+    for board, letter, move, score in positions:
+        game = make_game(board_class, board)
+        result = SmartComputerPlayer(letter, table=table).minimax(game, letter)
+        assert (result['position'], result['score']) == (move, score), board
+        assert game.get_board_copy() == board  # push/pop left the board as it was
+
+
+def test_iterative_deepening_matches_minimax(positions):
+    for board, letter, move, score in positions[::10]:
+        result = AlphaBetaSearch(iterative=True).search(make_game(TicTacToe, board), letter)
+        assert (result['position'], result['score'], result['proven']) == (move, score, True), board
+
+
+def test_cut_off_search_keeps_ordered_move():
+    # a budget-limited search on a big board must not fall back to square 0
+    game = GeneralizedTicTacToe(7, 7, 4)
+    game.make_move(24, 'X')
+    result = AlphaBetaSearch(max_nodes=3000).search(game, 'O')
+    assert not result['proven']
+    assert result['position'] != 0
+
+
+def test_board_configurations_do_not_share_cache_entries():
+    table = TranspositionTable()
+    SmartComputerPlayer('X', table=table).search(make_game(TicTacToe, list('X   O    ')))
+    game = GeneralizedTicTacToe(9, 1, 3)
+    game.make_move(6, 'X')
+    game.make_move(8, 'O')
+    expected = SmartComputerPlayer('X', table=TranspositionTable()).search(game)
+    assert SmartComputerPlayer('X', table=table).search(game) == expected
+
+
+def test_parallel_minimax_matches_serial():
+    game = GeneralizedTicTacToe(4, 3, 3)
+    for square, letter in ((5, 'X'), (6, 'O'), (1, 'X')):
+        game.make_move(square, letter)
+    player = SmartComputerPlayer('O', table=TranspositionTable(1000), workers=2, parallel_depth=1)
+    try:
+        assert player.parallel_minimax(game) == SmartComputerPlayer('O', table=TranspositionTable()).minimax(game, 'O')
+    finally:
+        player.close()
@@ -0,0 +1,91 @@
+"""
+Tests for the game server, driven by its local client harness.
+"""
+
+# Developed by phoenix marie.
+import asyncio
+import json
+import random
+
+import server
+
+
+async def with_server(test):
+    game_server = server.GameServer(workers=4, use_threads=True)
+    await game_server.start(port=0)
+    try:
+        return await test(game_server)
+    finally:
+        await game_server.close()
+
+
+async def connect(port):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+    async def request(line):
+        writer.write(line.encode() + b'\n')
+        await writer.drain()
+        return (await reader.readline()).decode().strip()
+
+    return request, writer
+
+
+def test_clients_play_full_games():
+    random.seed(3)
+
+    async def test(game_server):
+        stats = await server.run_clients(port=game_server.port(), clients=8, games=3, opponent='smart')
+        return stats, game_server.stats()
+
+    client, stats = asyncio.run(with_server(test))
+    assert client['games'] == 24
+    assert set(client['results']) <= {'X', 'O', 'TIE'}
+    assert stats['completed_sessions'] == 8
+    assert stats['completed_games'] == 24
+    assert stats['active_sessions'] == 0
+    assert len(stats['recent_sessions']) == 8
+
+
+def test_errors_and_stats():
+    async def test(game_server):
+        request, writer = await connect(game_server.port())
+        replies = [
+            await request('MOVE 4'),  # no game yet
+            await request('NEW Z random'),
+            await request('NEW X nobody'),
+            await request('NEW X random'),
+            await request('MOVE 9'),
+            await request('MOVE four'),
+            await request('STATS'),
+        ]
+        state = await request('MOVE 4')
+        taken = await request('MOVE 4')
+        await request('QUIT')
+        writer.close()
+        return replies, state, taken
+
+    replies, state, taken = asyncio.run(with_server(test))
+    assert all(reply.startswith('ERR') for reply in replies[:3])
+    assert replies[3] == 'STATE ......... TURN -'
+    assert replies[4].startswith('ERR') and replies[5].startswith('ERR')
+    stats = json.loads(replies[6][len('STATS '):])
+    assert stats['active_sessions'] == 1
+    assert [session['requests'] for session in stats['sessions']] == [6]
+    _, board, status, ai_move = state.split()
+    assert board[4] == 'X' and status == 'TURN'
+    assert board[int(ai_move)] == 'O' and board.count('.') == 7
+    assert taken.startswith('ERR')
+
+
+def test_failed_ai_move_answers_err(monkeypatch):
+    monkeypatch.setattr(server, 'compute_move', lambda *args: 1 / 0)
+
+    async def test(game_server):
+        request, writer = await connect(game_server.port())
+        replies = [await request('NEW O random'), await request('BOARD')]
+        writer.close()
+        return replies
+
+    failed, board = asyncio.run(with_server(test))
+    assert failed.startswith('ERR') and 'abandoned' in failed
+    assert board == 'ERR no game in progress'
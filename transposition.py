@@ -0,0 +1,72 @@
+"""
+Transposition table shared by the minimax players.
+
+Keeps search results for positions that have already been solved so that
+repeated searches (across moves and across games) don't walk the same
+subtrees again.
+"""
+
+# Developed by phoenix marie.
+from collections import OrderedDict
+
+
+class TranspositionTable():
+    """Bounded position cache with least-recently-used eviction."""
+    def __init__(self, maxsize=200000):
+        """
+        Initializes an empty table.
+
+        Args:
+            maxsize (int): Maximum number of entries kept before the least
+                recently used entry is evicted.
+        """
+        if maxsize <= 0:
+            raise ValueError("Transposition table size must be positive.")
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Returns hit/miss statistics as a dictionary."""
+        return {
+            'size': len(self.entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate(),
+        }